@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import base64
+import html
+import random
 import subprocess
 import sys
 import time
+import urllib.parse
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +27,17 @@ SHOT_FILENAMES = [
     "10-admin-mobile-viewport.png",
 ]
 
+_POLL_INITIAL_DELAY_S = 0.05
+_POLL_MAX_DELAY_S = 1.5
+
+# Ready once the admin panel shows something other than its "-" placeholder.
+_ADMIN_PAYLOAD_JS = (
+    "(sel) => { const el = document.querySelector(sel);"
+    " if (!el) return false;"
+    " const txt = (el.textContent || '').trim();"
+    " return txt !== '-' && txt.length > 2; }"
+)
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -32,7 +48,7 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--token", default="demo-admin-token")
     parser.add_argument("--filter-ticket-id", type=int, default=1101)
     parser.add_argument("--retry-ticket-id", type=int, default=1104)
-    parser.add_argument("--compose-file", type=Path, default=Path("docker-compose.demo.yml"))
+    parser.add_argument("--redis-container", default="redis-demo")
     parser.add_argument("--timeout-seconds", type=float, default=30.0)
     parser.add_argument("--headed", action="store_true")
     parser.add_argument("--check-only", action="store_true")
@@ -40,28 +56,31 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _compose(compose_file: Path, *args: str) -> subprocess.CompletedProcess[str]:
+def _docker(*args: str) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
-        ["docker", "compose", "-f", str(compose_file), *args],
+        ["docker", *args],
         capture_output=True,
         text=True,
         check=False,
     )
 
 
-def _wait_http_ok(label: str, url: str, *, timeout_s: float) -> None:
+def _wait_http_ok(client: httpx.Client, label: str, url: str, *, timeout_s: float) -> None:
     deadline = time.monotonic() + timeout_s
     last_error = ""
+    delay = _POLL_INITIAL_DELAY_S
     while time.monotonic() < deadline:
         try:
-            response = httpx.get(url, timeout=3.0)
+            response = client.get(url)
             if response.status_code == 200:
                 return
             last_error = f"HTTP {response.status_code}"
         except Exception as exc:  # pragma: no cover - defensive
             last_error = str(exc)
-        time.sleep(1.0)
-    raise RuntimeError(f"{label} not ready: {url} ({last_error})")
+        # Exponential backoff with jitter: react quickly once the service comes up.
+        time.sleep(min(delay, _POLL_MAX_DELAY_S) * random.uniform(0.8, 1.0))
+        delay *= 2
+    raise RuntimeError(f"{label} not ready: {client.base_url.join(url)} ({last_error})")
 
 
 def _dry_run(args: argparse.Namespace) -> int:
@@ -71,147 +90,194 @@ def _dry_run(args: argparse.Namespace) -> int:
     print("- Expected files:")
     for name in SHOT_FILENAMES:
         print(f"  - {name}")
-    print(f"- docker compose -f {args.compose_file} stop redis-demo")
-    print(f"- docker compose -f {args.compose_file} start redis-demo")
+    print(f"- docker stop {args.redis_container}")
+    print(f"- docker start {args.redis_container}")
     return 0
 
 
 def _import_playwright() -> Any:
     try:
-        from playwright.sync_api import Error, TimeoutError, sync_playwright
+        from playwright.async_api import Error, TimeoutError, async_playwright
     except ImportError as exc:
         raise RuntimeError(
             "Playwright is not installed. Install dev dependencies first, "
             "e.g. pip install -e '.[dev]'."
         ) from exc
-    return sync_playwright, Error, TimeoutError
+    return async_playwright, Error, TimeoutError
 
 
-def _check_browser_installation(*, headed: bool) -> None:
-    sync_playwright, Error, _ = _import_playwright()
+async def _check_browser_installation() -> None:
+    async_playwright, Error, _ = _import_playwright()
+    missing = RuntimeError(
+        "Playwright browser is not installed. Run: python -m playwright install chromium"
+    )
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=not headed)
-            browser.close()
+        # Resolving the executable path only needs the driver, not a Chromium launch.
+        async with async_playwright() as p:
+            executable = Path(p.chromium.executable_path)
     except Error as exc:
-        raise RuntimeError(
-            "Playwright browser is not installed. Run: python -m playwright install chromium"
-        ) from exc
-
-
-def _write_shot(page: Any, path: Path) -> None:
-    page.screenshot(path=str(path), full_page=True)
+        raise missing from exc
+    if not executable.is_file():
+        raise missing
+
+
+async def _open_page(context: Any) -> tuple[Any, Any]:
+    page = await context.new_page()
+    cdp = await context.new_cdp_session(page)
+    return page, cdp
+
+
+async def _write_shot(cdp: Any, path: Path) -> None:
+    # Raw CDP capture skips Playwright's screenshot post-processing; clip to the content
+    # size to keep the previous full-page output.
+    metrics = await cdp.send("Page.getLayoutMetrics")
+    size = metrics["cssContentSize"]
+    result = await cdp.send(
+        "Page.captureScreenshot",
+        {
+            "format": "png",
+            "optimizeForSpeed": True,
+            "captureBeyondViewport": True,
+            "clip": {"x": 0, "y": 0, "width": size["width"], "height": size["height"], "scale": 1},
+        },
+    )
+    path.write_bytes(base64.b64decode(result["data"]))
 
 
-def _wait_for_admin_payload(page: Any, selector: str, *, timeout_ms: int = 10_000) -> None:
-    page.wait_for_function(
-        "(sel) => { const el = document.querySelector(sel);"
-        " if (!el) return false;"
-        " const txt = (el.textContent || '').trim();"
-        " return txt !== '-' && txt.length > 2; }",
+async def _wait_for_admin_payload(page: Any, selector: str, *, timeout_ms: int = 10_000) -> None:
+    await page.wait_for_function(
+        _ADMIN_PAYLOAD_JS,
         arg=selector,
         timeout=timeout_ms,
     )
 
 
-def _capture(args: argparse.Namespace) -> int:
-    sync_playwright, Error, TimeoutError = _import_playwright()
+async def _desktop_flow(page: Any, cdp: Any, args: argparse.Namespace, out_dir: Path) -> None:
+    await page.goto(f"{args.base_url}/admin", wait_until="domcontentloaded")
+    await page.wait_for_selector("#token", timeout=10_000)
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[0])
+
+    await page.fill("#token", args.token)
+    await page.click("button:has-text('Refresh')")
+    await _wait_for_admin_payload(page, "#queue")
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[1])
+
+    # Refresh already loads the unfiltered history (loadAll), so no extra click is needed.
+    await _wait_for_admin_payload(page, "#history")
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[2])
+
+    await page.fill("#historyTicket", str(args.filter_ticket_id))
+    await page.click("button:has-text('Load History')")
+    await (
+        page.locator("#history")
+        .filter(has_text=str(args.filter_ticket_id))
+        .wait_for(timeout=10_000)
+    )
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[3])
+
+    await page.fill("#retryTicket", str(args.retry_ticket_id))
+    await page.click("button:has-text('Retry Ticket')")
+    await _wait_for_admin_payload(page, "#actions")
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[4])
+
+    # Capture DLQ state before drain.
+    await page.fill("#historyTicket", "")
+    await page.click("button:has-text('Refresh')")
+    await _wait_for_admin_payload(page, "#queue")
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[5])
+
+    await page.fill("#drainLimit", "100")
+    await page.click("button:has-text('Drain DLQ')")
+    await _wait_for_admin_payload(page, "#actions")
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[6])
+
+
+async def _unauthorized_flow(context: Any, args: argparse.Namespace, out_dir: Path) -> None:
+    # Fetch the JSON error over the context's API client and render it locally; no need to
+    # navigate the browser to the API route.
+    response = await context.request.get(f"{args.base_url}/admin/api/history?limit=10")
+    body = await response.text()
+    page, cdp = await _open_page(context)
+    document = f"<pre>HTTP {response.status}\n{html.escape(body)}</pre>"
+    await page.goto("data:text/html," + urllib.parse.quote(document))
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[7])
+    await page.close()
+
+
+async def _mobile_flow(context: Any, args: argparse.Namespace, out_dir: Path) -> None:
+    page, cdp = await _open_page(context)
+    await page.goto(f"{args.base_url}/admin", wait_until="domcontentloaded")
+    await page.wait_for_selector("#token", timeout=10_000)
+    await page.fill("#token", args.token)
+    await page.click("button:has-text('Refresh')")
+    await _wait_for_admin_payload(page, "#queue")
+    await _write_shot(cdp, out_dir / SHOT_FILENAMES[9])
+
+
+async def _capture(args: argparse.Namespace) -> int:
+    async_playwright, Error, TimeoutError = _import_playwright()
 
     out_dir = args.output_dir.expanduser().resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    _wait_http_ok("archiver", f"{args.base_url}/healthz", timeout_s=args.timeout_seconds)
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=not args.headed)
-        desktop = browser.new_context(viewport={"width": 1366, "height": 900})
-        page = desktop.new_page()
+    # One keep-alive client for all readiness polls; HTTP/2 is not used because the
+    # archiver serves cleartext HTTP/1.1 only.
+    with httpx.Client(base_url=args.base_url, timeout=1.0) as http:
+        await asyncio.to_thread(
+            _wait_http_ok,
+            http,
+            "archiver",
+            "/healthz",
+            timeout_s=args.timeout_seconds,
+        )
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=not args.headed)
+            desktop = await browser.new_context(viewport={"width": 1366, "height": 900})
+            mobile = await browser.new_context(viewport={"width": 390, "height": 844})
+            page, cdp = await _open_page(desktop)
 
-        redis_was_stopped = False
-        try:
-            page.goto(f"{args.base_url}/admin", wait_until="networkidle")
-            page.wait_for_selector("#token", timeout=10_000)
-            _write_shot(page, out_dir / SHOT_FILENAMES[0])
-
-            page.fill("#token", args.token)
-            page.click("button:has-text('Refresh')")
-            _wait_for_admin_payload(page, "#queue")
-            _write_shot(page, out_dir / SHOT_FILENAMES[1])
-
-            page.click("button:has-text('Load History')")
-            _wait_for_admin_payload(page, "#history")
-            _write_shot(page, out_dir / SHOT_FILENAMES[2])
-
-            page.fill("#historyTicket", str(args.filter_ticket_id))
-            page.click("button:has-text('Load History')")
-            page.wait_for_function(
-                "(tid) => (document.querySelector('#history')?.textContent || '')"
-                ".includes(String(tid))",
-                arg=args.filter_ticket_id,
-                timeout=10_000,
-            )
-            _write_shot(page, out_dir / SHOT_FILENAMES[3])
-
-            page.fill("#retryTicket", str(args.retry_ticket_id))
-            page.click("button:has-text('Retry Ticket')")
-            _wait_for_admin_payload(page, "#actions")
-            _write_shot(page, out_dir / SHOT_FILENAMES[4])
-
-            # Capture DLQ state before drain.
-            page.fill("#historyTicket", "")
-            page.click("button:has-text('Refresh')")
-            _wait_for_admin_payload(page, "#queue")
-            _write_shot(page, out_dir / SHOT_FILENAMES[5])
-
-            page.fill("#drainLimit", "100")
-            page.click("button:has-text('Drain DLQ')")
-            _wait_for_admin_payload(page, "#actions")
-            _write_shot(page, out_dir / SHOT_FILENAMES[6])
-
-            unauthorized_page = desktop.new_page()
-            unauthorized_page.goto(
-                f"{args.base_url}/admin/api/history?limit=10",
-                wait_until="networkidle",
-            )
-            _write_shot(unauthorized_page, out_dir / SHOT_FILENAMES[7])
-            unauthorized_page.close()
-
-            stop = _compose(args.compose_file, "stop", "redis-demo")
-            if stop.returncode != 0:
-                raise RuntimeError(f"unable to stop redis-demo: {stop.stderr.strip()}")
-            redis_was_stopped = True
-
-            page.click("button:has-text('Refresh')")
-            page.wait_for_function(
-                "() => (document.querySelector('#queue')?.textContent || '').includes('503')",
-                timeout=10_000,
-            )
-            _write_shot(page, out_dir / SHOT_FILENAMES[8])
-
-            start = _compose(args.compose_file, "start", "redis-demo")
-            if start.returncode != 0:
-                raise RuntimeError(f"unable to start redis-demo: {start.stderr.strip()}")
             redis_was_stopped = False
-            _wait_http_ok("archiver", f"{args.base_url}/healthz", timeout_s=args.timeout_seconds)
-
-            mobile = browser.new_context(viewport={"width": 390, "height": 844})
-            mobile_page = mobile.new_page()
-            mobile_page.goto(f"{args.base_url}/admin", wait_until="networkidle")
-            mobile_page.fill("#token", args.token)
-            mobile_page.click("button:has-text('Refresh')")
-            _wait_for_admin_payload(mobile_page, "#queue")
-            _write_shot(mobile_page, out_dir / SHOT_FILENAMES[9])
-            mobile.close()
-
-        except TimeoutError as exc:
-            raise RuntimeError(f"timeout while capturing screenshots: {exc}") from exc
-        except Error as exc:
-            raise RuntimeError(f"playwright error: {exc}") from exc
-        finally:
-            if redis_was_stopped:
-                _compose(args.compose_file, "start", "redis-demo")
-            desktop.close()
-            browser.close()
+            try:
+                # Only the read-only 401 shot overlaps the desktop flow. The desktop flow
+                # retries and drains jobs, so the mobile queue shot runs after it to show the
+                # settled state; the redis outage below must stay sequential too.
+                await asyncio.gather(
+                    _desktop_flow(page, cdp, args, out_dir),
+                    _unauthorized_flow(desktop, args, out_dir),
+                )
+                await _mobile_flow(mobile, args, out_dir)
+
+                stop = await asyncio.to_thread(_docker, "stop", args.redis_container)
+                if stop.returncode != 0:
+                    raise RuntimeError(
+                        f"unable to stop {args.redis_container}: {stop.stderr.strip()}"
+                    )
+                redis_was_stopped = True
+
+                await page.click("button:has-text('Refresh')")
+                await page.locator("#queue").filter(has_text="503").wait_for(timeout=10_000)
+                await _write_shot(cdp, out_dir / SHOT_FILENAMES[8])
+
+                start = await asyncio.to_thread(_docker, "start", args.redis_container)
+                if start.returncode != 0:
+                    raise RuntimeError(
+                        f"unable to start {args.redis_container}: {start.stderr.strip()}"
+                    )
+                # No archiver readiness wait here: /healthz does not depend on redis and no
+                # shot follows the outage.
+                redis_was_stopped = False
+
+            except TimeoutError as exc:
+                raise RuntimeError(f"timeout while capturing screenshots: {exc}") from exc
+            except Error as exc:
+                raise RuntimeError(f"playwright error: {exc}") from exc
+            finally:
+                if redis_was_stopped:
+                    await asyncio.to_thread(_docker, "start", args.redis_container)
+                await mobile.close()
+                await desktop.close()
+                await browser.close()
 
     print(f"Captured {len(SHOT_FILENAMES)} screenshots in {out_dir}")
     return 0
@@ -224,12 +290,12 @@ def main() -> int:
         return _dry_run(args)
 
     if args.check_only:
-        _check_browser_installation(headed=args.headed)
+        asyncio.run(_check_browser_installation())
         print("Playwright Chromium check OK")
         return 0
 
     try:
-        return _capture(args)
+        return asyncio.run(_capture(args))
     except RuntimeError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 2
@@ -2,19 +2,74 @@ from __future__ import annotations
 
 import argparse
 import copy
+import hmac
+import importlib
 import json
 import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
+import httpx
 import uvicorn
-from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
+# (tickets, tags, articles, next_article_id)
+_SeedData = tuple[
+    dict[int, dict[str, Any]], dict[int, list[str]], dict[int, list[dict[str, Any]]], int
+]
+
+
+_MAX_DATASET_BYTES = 64 * 1024 * 1024
+_EVENTS_TAIL = 50
+
+
+def _import_orjson() -> Any:
+    # Optional speedup; the mock works with stdlib json alone.
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+_orjson = _import_orjson()
+
+_ts_cache: tuple[int, str] = (0, "")
+
 
 def _iso_now() -> str:
-    return datetime.now(UTC).isoformat()
+    # Same format as datetime.now(UTC).isoformat(); the date/second prefix is reformatted only
+    # when the second changes and the microseconds are appended per call.
+    global _ts_cache
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (second, prefix)
+    if micros == 0:
+        return f"{prefix}+00:00"
+    return f"{prefix}.{micros:06d}+00:00"
+
+
+def _raw_json_response(body: bytes) -> Response:
+    return Response(body, media_type="application/json")
+
+
+def _json_response(payload: Any) -> Response:
+    # Read routes hand FastAPI a finished Response: no response-model validation or
+    # jsonable_encoder walk.
+    return _raw_json_response(_dump_json(payload))
+
+
+def _dump_json(payload: Any) -> bytes:
+    if _orjson is not None:
+        return cast(bytes, _orjson.dumps(payload))
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 class TagMutation(BaseModel):
@@ -31,21 +86,52 @@ class NewArticle(BaseModel):
     internal: bool = True
 
 
+@dataclass(frozen=True)
+class _Snapshot:
+    """Immutable view of the store; writers publish a new one instead of mutating."""
+
+    tickets: dict[int, dict[str, Any]]
+    tags: dict[int, list[str]]
+    articles: dict[int, list[dict[str, Any]]]
+    next_article_id: int
+    # Serialized read views, built lazily per snapshot.
+    ticket_json: dict[int, bytes] = field(default_factory=dict)
+    articles_json: dict[int, bytes] = field(default_factory=dict)
+
+
 class DemoStore:
     def __init__(self, dataset_path: Path) -> None:
         self._dataset_path = dataset_path
-        self._lock = threading.Lock()
-        self._dataset_template = self._load_dataset(dataset_path)
-        self._tickets: dict[int, dict[str, Any]] = {}
-        self._tags: dict[int, list[str]] = {}
-        self._articles: dict[int, list[dict[str, Any]]] = {}
-        self._events: list[dict[str, Any]] = []
-        self._next_article_id: int = 1
+        self._write_lock = threading.Lock()
+        self._events_lock = threading.Lock()
+        dataset = self._load_dataset(dataset_path)
+        # The dataset never changes at runtime: normalize it once. Snapshots are never
+        # mutated in place, so reset() can publish the templates directly.
+        (
+            self._tickets_tpl,
+            self._tags_tpl,
+            self._articles_tpl,
+            self._next_article_id_tpl,
+        ) = self._build_seed(dataset)
+        self._seed_plan_count = len(dataset.get("seed_plan", []))
+        # Tickets are only ever (re)seeded from the template, never created or deleted.
+        self._ticket_ids_sorted = sorted(self._tickets_tpl)
+        # Number and title are immutable too; keep them as flat columns for state().
+        self._ticket_numbers = [self._tickets_tpl[t]["number"] for t in self._ticket_ids_sorted]
+        self._ticket_titles = [self._tickets_tpl[t].get("title") for t in self._ticket_ids_sorted]
+        self._snapshot = _Snapshot(tickets={}, tags={}, articles={}, next_article_id=1)
+        # Only the tail is ever exposed (state()), so keep a bounded ring buffer.
+        self._events: deque[dict[str, Any]] = deque(maxlen=_EVENTS_TAIL)
         self.reset()
 
     @staticmethod
     def _load_dataset(path: Path) -> dict[str, Any]:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        size = path.stat().st_size
+        if size > _MAX_DATASET_BYTES:
+            raise ValueError(f"dataset too large: {size} bytes (max {_MAX_DATASET_BYTES})")
+        raw = path.read_bytes()
+        # Parse straight from bytes; skips the intermediate str from read_text().
+        payload = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
         if not isinstance(payload, dict):
             raise ValueError("dataset must be a JSON object")
         tickets = payload.get("tickets")
@@ -53,111 +139,132 @@ class DemoStore:
             raise ValueError("dataset.tickets must be a non-empty list")
         return payload
 
-    def reset(self) -> dict[str, Any]:
-        with self._lock:
-            template = copy.deepcopy(self._dataset_template)
-            tickets = template.get("tickets", [])
-
-            self._tickets = {}
-            self._tags = {}
-            self._articles = {}
-            self._events = []
-
-            max_article_id = 1
-            for item in tickets:
-                ticket_id = int(item["id"])
-                created = item.get("created_at") or _iso_now()
-                updated = item.get("updated_at") or created
-                self._tickets[ticket_id] = {
-                    "id": ticket_id,
-                    "number": str(item.get("number") or f"UNI-{ticket_id}"),
-                    "title": item.get("title"),
-                    "owner": {"login": item.get("owner_login")},
-                    "updated_by": {"login": item.get("updated_by_login")},
-                    "customer": item.get("customer") or {},
-                    "preferences": {
-                        "custom_fields": item.get("custom_fields") or {},
-                    },
-                    "created_at": created,
-                    "updated_at": updated,
-                }
-                self._tags[ticket_id] = [str(t) for t in item.get("tags", [])]
-
-                articles: list[dict[str, Any]] = []
-                for article in item.get("articles", []):
-                    article_id = int(article.get("id") or max_article_id)
-                    max_article_id = max(max_article_id, article_id + 1)
-                    articles.append(
-                        {
-                            "id": article_id,
-                            "created_at": article.get("created_at") or _iso_now(),
-                            "internal": bool(article.get("internal", False)),
-                            "subject": article.get("subject") or "",
-                            "body": article.get("body") or "",
-                            "content_type": article.get("content_type") or "text/plain",
-                            "from": article.get("from") or "",
-                            "to": article.get("to") or "",
-                            "attachments": article.get("attachments") or [],
-                        }
-                    )
-                self._articles[ticket_id] = articles
-
-            self._next_article_id = max_article_id
-            self._events.append({"ts": _iso_now(), "event": "reset", "tickets": len(self._tickets)})
-
-            return {
-                "status": "ok",
-                "tickets": len(self._tickets),
-                "seed_plan_count": len(template.get("seed_plan", [])),
+    @staticmethod
+    def _build_seed(dataset: dict[str, Any]) -> _SeedData:
+        tickets: dict[int, dict[str, Any]] = {}
+        tags: dict[int, list[str]] = {}
+        articles_by_ticket: dict[int, list[dict[str, Any]]] = {}
+
+        max_article_id = 1
+        for item in dataset.get("tickets", []):
+            ticket_id = int(item["id"])
+            created = item.get("created_at") or _iso_now()
+            updated = item.get("updated_at") or created
+            tickets[ticket_id] = {
+                "id": ticket_id,
+                "number": str(item.get("number") or f"UNI-{ticket_id}"),
+                "title": item.get("title"),
+                "owner": {"login": item.get("owner_login")},
+                "updated_by": {"login": item.get("updated_by_login")},
+                "customer": item.get("customer") or {},
+                "preferences": {
+                    "custom_fields": item.get("custom_fields") or {},
+                },
+                "created_at": created,
+                "updated_at": updated,
             }
+            tags[ticket_id] = [str(t) for t in item.get("tags", [])]
+
+            articles: list[dict[str, Any]] = []
+            for article in item.get("articles", []):
+                article_id = int(article.get("id") or max_article_id)
+                max_article_id = max(max_article_id, article_id + 1)
+                articles.append(
+                    {
+                        "id": article_id,
+                        "created_at": article.get("created_at") or _iso_now(),
+                        "internal": bool(article.get("internal", False)),
+                        "subject": article.get("subject") or "",
+                        "body": article.get("body") or "",
+                        "content_type": article.get("content_type") or "text/plain",
+                        "from": article.get("from") or "",
+                        "to": article.get("to") or "",
+                        "attachments": article.get("attachments") or [],
+                    }
+                )
+            articles_by_ticket[ticket_id] = articles
+
+        return tickets, tags, articles_by_ticket, max_article_id
 
-    def get_ticket(self, ticket_id: int) -> dict[str, Any]:
-        with self._lock:
-            ticket = self._tickets.get(ticket_id)
+    def _append_event(self, event: dict[str, Any]) -> None:
+        with self._events_lock:
+            self._events.append(event)
+
+    def reset(self) -> dict[str, Any]:
+        with self._write_lock:
+            self._snapshot = _Snapshot(
+                tickets=self._tickets_tpl,
+                tags=self._tags_tpl,
+                articles=self._articles_tpl,
+                next_article_id=self._next_article_id_tpl,
+            )
+            with self._events_lock:
+                self._events.clear()
+                self._events.append(
+                    {"ts": _iso_now(), "event": "reset", "tickets": len(self._tickets_tpl)}
+                )
+
+        return {
+            "status": "ok",
+            "tickets": len(self._tickets_tpl),
+            "seed_plan_count": self._seed_plan_count,
+        }
+
+    def get_ticket_json(self, ticket_id: int) -> bytes:
+        snap = self._snapshot
+        cached = snap.ticket_json.get(ticket_id)
+        if cached is None:
+            ticket = snap.tickets.get(ticket_id)
             if ticket is None:
                 raise KeyError(ticket_id)
-            return copy.deepcopy(ticket)
+            cached = snap.ticket_json[ticket_id] = _dump_json(ticket)
+        return cached
 
     def get_tags(self, ticket_id: int) -> list[str]:
-        with self._lock:
-            return list(self._tags.get(ticket_id, []))
+        return list(self._snapshot.tags.get(ticket_id, []))
 
     def set_tag(self, ticket_id: int, *, tag: str, present: bool) -> dict[str, Any]:
-        with self._lock:
-            if ticket_id not in self._tickets:
+        with self._write_lock:
+            snap = self._snapshot
+            if ticket_id not in snap.tickets:
                 raise KeyError(ticket_id)
-            tags = self._tags.setdefault(ticket_id, [])
+            tags = snap.tags.get(ticket_id, [])
             if present:
                 if tag not in tags:
-                    tags.append(tag)
+                    tags = [*tags, tag]
                 action = "tag_add"
             else:
                 tags = [x for x in tags if x != tag]
-                self._tags[ticket_id] = tags
                 action = "tag_remove"
-            self._events.append(
-                {
-                    "ts": _iso_now(),
-                    "event": action,
-                    "ticket_id": ticket_id,
-                    "tag": tag,
-                    "tags": list(tags),
-                }
-            )
-            return {"status": "ok", "ticket_id": ticket_id, "tags": list(tags)}
-
-    def list_articles(self, ticket_id: int) -> list[dict[str, Any]]:
-        with self._lock:
-            if ticket_id not in self._tickets:
+            self._snapshot = replace(snap, tags={**snap.tags, ticket_id: tags})
+        self._append_event(
+            {
+                "ts": _iso_now(),
+                "event": action,
+                "ticket_id": ticket_id,
+                "tag": tag,
+                "tags": list(tags),
+            }
+        )
+        return {"status": "ok", "ticket_id": ticket_id, "tags": list(tags)}
+
+    def list_articles_json(self, ticket_id: int) -> bytes:
+        snap = self._snapshot
+        cached = snap.articles_json.get(ticket_id)
+        if cached is None:
+            if ticket_id not in snap.tickets:
                 raise KeyError(ticket_id)
-            return copy.deepcopy(self._articles.get(ticket_id, []))
+            cached = _dump_json(snap.articles.get(ticket_id, []))
+            snap.articles_json[ticket_id] = cached
+        return cached
 
     def add_article(self, payload: NewArticle) -> dict[str, Any]:
-        with self._lock:
-            if payload.ticket_id not in self._tickets:
+        with self._write_lock:
+            snap = self._snapshot
+            if payload.ticket_id not in snap.tickets:
                 raise KeyError(payload.ticket_id)
             article = {
-                "id": self._next_article_id,
+                "id": snap.next_article_id,
                 "created_at": _iso_now(),
                 "internal": bool(payload.internal),
                 "subject": payload.subject,
@@ -167,41 +274,55 @@ class DemoStore:
                 "to": "",
                 "attachments": [],
             }
-            self._next_article_id += 1
-            self._articles.setdefault(payload.ticket_id, []).append(article)
-            self._events.append(
-                {
-                    "ts": _iso_now(),
-                    "event": "article_created",
-                    "ticket_id": payload.ticket_id,
-                    "article_id": article["id"],
-                    "subject": payload.subject,
-                }
+            articles_json = dict(snap.articles_json)
+            articles_json.pop(payload.ticket_id, None)
+            self._snapshot = replace(
+                snap,
+                articles={
+                    **snap.articles,
+                    payload.ticket_id: [*snap.articles.get(payload.ticket_id, []), article],
+                },
+                next_article_id=snap.next_article_id + 1,
+                articles_json=articles_json,
             )
-            return copy.deepcopy(article)
+        self._append_event(
+            {
+                "ts": _iso_now(),
+                "event": "article_created",
+                "ticket_id": payload.ticket_id,
+                "article_id": article["id"],
+                "subject": payload.subject,
+            }
+        )
+        return copy.deepcopy(article)
 
-    def state(self) -> dict[str, Any]:
-        with self._lock:
-            items = []
-            for ticket_id in sorted(self._tickets.keys()):
-                ticket = self._tickets[ticket_id]
-                items.append(
-                    {
-                        "ticket_id": ticket_id,
-                        "number": ticket["number"],
-                        "title": ticket.get("title"),
-                        "tags": list(self._tags.get(ticket_id, [])),
-                        "article_count": len(self._articles.get(ticket_id, [])),
-                    }
-                )
+    def ticket_count(self) -> int:
+        return len(self._snapshot.tickets)
 
-            return {
-                "status": "ok",
-                "dataset": str(self._dataset_path),
-                "ticket_count": len(self._tickets),
-                "tickets": items,
-                "events_tail": self._events[-50:],
+    def state(self) -> dict[str, Any]:
+        snap = self._snapshot
+        items = [
+            {
+                "ticket_id": ticket_id,
+                "number": number,
+                "title": title,
+                "tags": list(snap.tags.get(ticket_id, [])),
+                "article_count": len(snap.articles.get(ticket_id, [])),
             }
+            for ticket_id, number, title in zip(
+                self._ticket_ids_sorted, self._ticket_numbers, self._ticket_titles, strict=True
+            )
+        ]
+        with self._events_lock:
+            events_tail = list(self._events)
+
+        return {
+            "status": "ok",
+            "dataset": str(self._dataset_path),
+            "ticket_count": len(snap.tickets),
+            "tickets": items,
+            "events_tail": events_tail,
+        }
 
 
 class AppConfig(BaseModel):
@@ -216,9 +337,10 @@ class AppState:
 
 
 def _auth_dependency(state: AppState):
+    expected = f"Token token={state.config.api_token}".encode()
+
     def _verify(authorization: str | None = Header(default=None)) -> None:
-        expected = f"Token token={state.config.api_token}"
-        if authorization != expected:
+        if authorization is None or not hmac.compare_digest(authorization.encode(), expected):
             raise HTTPException(status_code=401, detail="unauthorized")
 
     return _verify
@@ -227,37 +349,43 @@ def _auth_dependency(state: AppState):
 def create_app(*, dataset_path: Path, api_token: str) -> FastAPI:
     config = AppConfig(dataset_path=dataset_path, api_token=api_token)
     state = AppState(config)
-    app = FastAPI(title="mock-zammad-api", version="1.0")
+    app = FastAPI(
+        title="mock-zammad-api",
+        version="1.0",
+        default_response_class=ORJSONResponse if _orjson is not None else JSONResponse,
+    )
     auth = _auth_dependency(state)
 
-    @app.get("/healthz")
-    async def healthz() -> dict[str, Any]:
-        return {"status": "ok", "time": _iso_now(), "tickets": state.store.state()["ticket_count"]}
+    @app.get("/healthz", response_model=None)
+    async def healthz() -> Response:
+        return _json_response(
+            {"status": "ok", "time": _iso_now(), "tickets": state.store.ticket_count()}
+        )
 
     @app.post("/__demo/reset")
     async def demo_reset() -> dict[str, Any]:
         return state.store.reset()
 
-    @app.get("/__demo/state")
-    async def demo_state() -> dict[str, Any]:
-        return state.store.state()
+    @app.get("/__demo/state", response_model=None)
+    async def demo_state() -> Response:
+        return _json_response(state.store.state())
 
-    @app.get("/api/v1/tickets/{ticket_id}")
-    async def get_ticket(ticket_id: int, _: None = Depends(auth)) -> dict[str, Any]:
+    @app.get("/api/v1/tickets/{ticket_id}", response_model=None)
+    async def get_ticket(ticket_id: int, _: None = Depends(auth)) -> Response:
         try:
-            return state.store.get_ticket(ticket_id)
+            return _raw_json_response(state.store.get_ticket_json(ticket_id))
         except KeyError as exc:
             raise HTTPException(status_code=404, detail="ticket_not_found") from exc
 
-    @app.get("/api/v1/tags")
+    @app.get("/api/v1/tags", response_model=None)
     async def get_tags(
         object: str | None = None,  # noqa: A002
         o_id: int | None = None,
         _: None = Depends(auth),
-    ) -> dict[str, Any]:
+    ) -> Response:
         if object != "Ticket" or o_id is None:
             raise HTTPException(status_code=400, detail="invalid_tag_query")
-        return {"tags": state.store.get_tags(o_id)}
+        return _json_response({"tags": state.store.get_tags(o_id)})
 
     @app.post("/api/v1/tags/add")
     async def add_tag(payload: TagMutation, _: None = Depends(auth)) -> dict[str, Any]:
@@ -277,10 +405,10 @@ def create_app(*, dataset_path: Path, api_token: str) -> FastAPI:
         except KeyError as exc:
             raise HTTPException(status_code=404, detail="ticket_not_found") from exc
 
-    @app.get("/api/v1/ticket_articles/by_ticket/{ticket_id}")
-    async def list_articles(ticket_id: int, _: None = Depends(auth)) -> list[dict[str, Any]]:
+    @app.get("/api/v1/ticket_articles/by_ticket/{ticket_id}", response_model=None)
+    async def list_articles(ticket_id: int, _: None = Depends(auth)) -> Response:
         try:
-            return state.store.list_articles(ticket_id)
+            return _raw_json_response(state.store.list_articles_json(ticket_id))
         except KeyError as exc:
             raise HTTPException(status_code=404, detail="ticket_not_found") from exc
 
@@ -294,6 +422,19 @@ def create_app(*, dataset_path: Path, api_token: str) -> FastAPI:
     return app
 
 
+def create_inprocess_client(*, dataset_path: Path, api_token: str) -> httpx.AsyncClient:
+    """Client that talks to the mock app over ASGI, without Uvicorn or a socket.
+
+    Suitable as the ``http_client`` of ``AsyncZammadClient`` in single-process setups.
+    """
+    app = create_app(dataset_path=dataset_path, api_token=api_token)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://zammad-mock/",
+        headers={"Authorization": f"Token token={api_token}", "Accept": "application/json"},
+    )
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run local mock Zammad API service")
     parser.add_argument("--host", default="0.0.0.0")
@@ -314,7 +455,15 @@ def main() -> int:
         raise SystemExit(f"Dataset not found: {dataset_path}")
 
     app = create_app(dataset_path=dataset_path, api_token=args.token)
-    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+    uvicorn.run(
+        app,
+        host=args.host,
+        port=args.port,
+        loop="auto",
+        http="auto",
+        access_log=False,
+        log_level="warning",
+    )
     return 0
 
 
@@ -27,22 +27,45 @@ def _iter_cert_files(paths: list[Path]) -> list[Path]:
 def _load_certs_from_paths(paths: list[Path]) -> list[object]:
     # Cert objects are asn1crypto.x509.Certificate instances; keep typing loose to
     # avoid importing pyHanko at module import time.
-    from pyhanko.keys import load_certs_from_pemder_data
+    from asn1crypto import pem  # type: ignore[import-untyped]
 
-    certs: list[object] = []
+    pem_files: list[tuple[Path, bytes]] = []
+    der_files: list[tuple[Path, bytes]] = []
     for cert_file in _iter_cert_files(paths):
         try:
             data = cert_file.read_bytes()
         except OSError as exc:
             raise RuntimeError(f"Failed to read certificate file: {cert_file}") from exc
+        (pem_files if pem.detect(data) else der_files).append((cert_file, data))
 
+    certs: list[object] = []
+    if pem_files:
+        # PEM bundles concatenate cleanly, so parse all of them in a single pass; only
+        # re-parse file by file to name the culprit when that fails.
         try:
-            certs.extend(list(load_certs_from_pemder_data(data)))
-        except Exception as exc:  # noqa: BLE001 - report parsing issues clearly for ops
-            raise RuntimeError(f"Failed to parse certificate(s) in: {cert_file}") from exc
+            certs.extend(_parse_certs(b"\n".join(data for _, data in pem_files)))
+        except Exception as exc:  # noqa: BLE001 - locate the offending file below
+            for cert_file, data in pem_files:
+                _parse_cert_file(cert_file, data)
+            raise RuntimeError("Failed to parse PEM certificate bundle") from exc
+    for cert_file, data in der_files:
+        certs.extend(_parse_cert_file(cert_file, data))
     return certs
 
 
+def _parse_certs(data: bytes) -> list[object]:
+    from pyhanko.keys import load_certs_from_pemder_data
+
+    return list(load_certs_from_pemder_data(data))
+
+
+def _parse_cert_file(cert_file: Path, data: bytes) -> list[object]:
+    try:
+        return _parse_certs(data)
+    except Exception as exc:  # noqa: BLE001 - report parsing issues clearly for ops
+        raise RuntimeError(f"Failed to parse certificate(s) in: {cert_file}") from exc
+
+
 def main() -> int:
     if len(sys.argv) != 2:
         print("Usage: scripts/ops/verify-pdf.py /path/to/file.pdf", file=sys.stderr)
@@ -65,12 +88,8 @@ def main() -> int:
         print(f"Import error: {exc}", file=sys.stderr)
         return 2
 
-    trust_paths = _split_paths(os.environ.get("VERIFY_PDF_TRUST", "")) if os.environ.get(
-        "VERIFY_PDF_TRUST"
-    ) else []
-    other_paths = _split_paths(os.environ.get("VERIFY_PDF_OTHER_CERTS", "")) if os.environ.get(
-        "VERIFY_PDF_OTHER_CERTS"
-    ) else []
+    trust_paths = _split_paths(os.environ.get("VERIFY_PDF_TRUST", ""))
+    other_paths = _split_paths(os.environ.get("VERIFY_PDF_OTHER_CERTS", ""))
 
     trust_replace = os.environ.get("VERIFY_PDF_TRUST_REPLACE", "") == "1"
     retroactive_revinfo = os.environ.get("VERIFY_PDF_RETROACTIVE_REVINFO", "") == "1"
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import httpx
 from starlette.types import Receive
 
 
+@lru_cache(maxsize=16)
 def timeouts_for(seconds: float) -> httpx.Timeout:
-    """Build httpx.Timeout with bounded connect/pool for fail-fast on unreachable upstreams."""
+    """
+    Build httpx.Timeout with bounded connect/pool for fail-fast on unreachable upstreams.
+
+    Cached per value: callers share one Timeout instance, which must be treated as read-only.
+    """
     total = float(seconds)
     connect = min(5.0, total)
     return httpx.Timeout(connect=connect, read=total, write=total, pool=connect)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from zammad_pdf_archiver.adapters.storage.fs_storage import ensure_dir, write_atomic_bytes
+
+_CACHE_SUFFIX = ".pdf"
+
+
+def _cache_path(cache_dir: Path, key: bytes) -> Path:
+    return cache_dir / f"{key.hex()}{_CACHE_SUFFIX}"
+
+
+def read_cached_pdf(cache_dir: Path, key: bytes) -> bytes | None:
+    """
+    Return cached PDF bytes for key, or None on miss.
+
+    A hit bumps the entry's mtime so eviction drops least recently used entries first
+    (atime is unreliable on relatime/noatime mounts).
+    """
+    path = _cache_path(cache_dir, key)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if not data:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+
+def store_cached_pdf(cache_dir: Path, key: bytes, data: bytes, *, max_bytes: int) -> None:
+    """Best-effort atomic write of a rendered PDF, then evict down to max_bytes (0 = no cap)."""
+    try:
+        ensure_dir(cache_dir)
+        write_atomic_bytes(_cache_path(cache_dir, key), data, storage_root=cache_dir, fsync=False)
+        if max_bytes > 0:
+            _evict(cache_dir, max_bytes)
+    except (OSError, ValueError):
+        # The cache is an optimization only; a failed write must not fail the render.
+        return
+
+
+def _evict(cache_dir: Path, max_bytes: int) -> None:
+    entries: list[tuple[int, int, str]] = []
+    total = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(_CACHE_SUFFIX) or not entry.is_file(follow_symlinks=False):
+                continue
+            st = entry.stat(follow_symlinks=False)
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+            total += st.st_size
+
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _mtime, size, path in entries:
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            return
@@ -1,30 +1,62 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
+import importlib
+import os
 import warnings
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
+from typing import Any, BinaryIO, overload
 
-from zammad_pdf_archiver.adapters.pdf.template_engine import render_html, validate_template_name
+from zammad_pdf_archiver.adapters.pdf.render_cache import read_cached_pdf, store_cached_pdf
+from zammad_pdf_archiver.adapters.pdf.template_engine import (
+    render_html_bytes,
+    validate_template_name,
+)
 from zammad_pdf_archiver.adapters.pdf.url_fetcher import _safe_url_fetcher
 from zammad_pdf_archiver.domain.errors import PermanentError
 from zammad_pdf_archiver.domain.snapshot_models import Snapshot
 
 _TEMPLATE_STYLES_MAIN = "styles.css"
+_CSS_PARALLEL_READ_MIN_FILES = 2
+_CSS_READ_MAX_WORKERS = 8
 
 
-@contextmanager
-def _template_folder_path(template_name: str, templates_root: Path | None = None):
+def _import_blake3() -> Any:
+    try:
+        return importlib.import_module("blake3").blake3
+    except ImportError:
+        return None
+
+
+_blake3 = _import_blake3()
+
+
+# Holds extracted package templates (zip installs) open for the process lifetime.
+_TEMPLATES_STACK = ExitStack()
+atexit.register(_TEMPLATES_STACK.close)
+
+
+def _template_folder_path(template_name: str, templates_root: Path | None = None) -> Path:
     template_name = validate_template_name(template_name)
 
     if templates_root is not None:
-        yield templates_root.expanduser() / template_name
-        return
+        return templates_root.expanduser() / template_name
+
+    return _packaged_template_folder(template_name)
 
+
+@lru_cache(maxsize=16)
+def _packaged_template_folder(template_name: str) -> Path:
+    # as_file is a no-op for regular installs; zipped installs extract once per template
+    # instead of creating and removing a temp copy on every render.
     traversable = resources.files("zammad_pdf_archiver").joinpath("templates", template_name)
-    with resources.as_file(traversable) as path:
-        yield path
+    return _TEMPLATES_STACK.enter_context(resources.as_file(traversable))
 
 
 def _css_file_paths(template_folder: Path) -> list[Path]:
@@ -40,30 +72,41 @@ def _css_file_paths(template_folder: Path) -> list[Path]:
 
 
 def _template_css_paths(template_folder: Path) -> list[Path]:
-    files: list[Path] = []
-    main = template_folder / _TEMPLATE_STYLES_MAIN
-    if main.exists() and main.is_file():
-        files.append(main)
+    # One scandir pass over the template folder; only the css/ subtree needs further walks.
+    main: str | None = None
+    siblings: list[str] = []
+    nested: list[str] = []
+    with os.scandir(template_folder) as entries:
+        for entry in entries:
+            if entry.name == "css" and entry.is_dir():
+                nested = _nested_css_paths(entry.path)
+            elif entry.name.endswith(".css") and entry.is_file():
+                if entry.name == _TEMPLATE_STYLES_MAIN:
+                    main = entry.path
+                else:
+                    siblings.append(entry.path)
 
-    files.extend(_sibling_css_paths(template_folder))
-    files.extend(_nested_css_paths(template_folder / "css"))
-    return files
+    ordered = ([main] if main is not None else []) + _sorted_paths(siblings) + nested
+    return [Path(path) for path in ordered]
 
 
-def _sibling_css_paths(template_folder: Path) -> list[Path]:
-    files: list[Path] = []
-    for path in sorted(template_folder.glob("*.css")):
-        if path.name == _TEMPLATE_STYLES_MAIN:
-            continue
-        if path.is_file():
-            files.append(path)
-    return files
+def _nested_css_paths(css_dir: str) -> list[str]:
+    # Same selection as Path.rglob("*.css"): symlinked directories are not descended into.
+    found: list[str] = []
+    stack = [css_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".css") and entry.is_file():
+                    found.append(entry.path)
+    return _sorted_paths(found)
 
 
-def _nested_css_paths(css_dir: Path) -> list[Path]:
-    if not css_dir.exists() or not css_dir.is_dir():
-        return []
-    return [path for path in sorted(css_dir.rglob("*.css")) if path.is_file()]
+def _sorted_paths(paths: list[str]) -> list[str]:
+    # Component-wise order, matching how sorted() orders Path objects.
+    return sorted(paths, key=lambda path: path.split(os.sep))
 
 
 def _prepend_shared_css(template_folder: Path, files: list[Path]) -> list[Path]:
@@ -77,6 +120,104 @@ def _prepend_shared_css(template_folder: Path, files: list[Path]) -> list[Path]:
     return files
 
 
+@dataclass(frozen=True, slots=True)
+class _TemplateAssets:
+    css_paths: tuple[Path, ...]
+    css_bytes: bytes
+    stylesheets: tuple[Any, ...]
+
+
+def _css_fingerprint(css_paths: list[Path]) -> tuple[tuple[str, int, int], ...]:
+    fingerprint = []
+    for path in css_paths:
+        st = path.stat()
+        fingerprint.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(fingerprint)
+
+
+@lru_cache(maxsize=32)
+def _load_template_assets(fingerprint: tuple[tuple[str, int, int], ...]) -> _TemplateAssets:
+    css_paths = tuple(Path(entry[0]) for entry in fingerprint)
+    css_bytes = b"".join(_read_css_files(css_paths))
+
+    from weasyprint import CSS  # type: ignore[import-untyped]
+
+    stylesheets = tuple(CSS(filename=str(path)) for path in css_paths)
+    return _TemplateAssets(css_paths=css_paths, css_bytes=css_bytes, stylesheets=stylesheets)
+
+
+def _read_css_files(css_paths: tuple[Path, ...]) -> list[bytes]:
+    # Overlap the reads when a template ships several stylesheets (cold page cache or
+    # network filesystems); a pool is not worth starting for one or two files.
+    if len(css_paths) <= _CSS_PARALLEL_READ_MIN_FILES:
+        return [path.read_bytes() for path in css_paths]
+    with ThreadPoolExecutor(max_workers=min(len(css_paths), _CSS_READ_MAX_WORKERS)) as pool:
+        return list(pool.map(Path.read_bytes, css_paths))
+
+
+def _template_assets(template_folder: Path) -> _TemplateAssets:
+    """
+    CSS bytes and parsed stylesheets for a template folder.
+
+    Cached by (path, mtime, size) of every stylesheet, so edits to a custom templates root
+    are picked up on the next render without re-reading and re-parsing unchanged CSS.
+    """
+    return _load_template_assets(_css_fingerprint(_css_file_paths(template_folder)))
+
+
+def _pdf_identifier(html: bytes, css_bytes: bytes) -> bytes:
+    """
+    128-bit content hash of the rendered HTML and template CSS.
+
+    Uses BLAKE3 when the optional `blake3` package is installed (SIMD, multi-lane) and
+    SHA-256 otherwise. The identifier is opaque to PDF consumers; it also keys the render
+    cache, which simply misses once after switching hashes.
+    """
+    # Feed the hasher piecewise instead of concatenating html + CSS into one buffer.
+    if _blake3 is not None:
+        fast = _blake3(html)
+        fast.update(b"\0")
+        fast.update(css_bytes)
+        return bytes(fast.digest(length=16))
+    hasher = hashlib.sha256(html)
+    hasher.update(b"\0")
+    hasher.update(css_bytes)
+    return hasher.digest()[:16]
+
+
+def _template_asset_fingerprint(template_folder: Path) -> tuple[tuple[str, int, int], ...]:
+    # Images, fonts and other non-CSS files the url fetcher may load from the template folder;
+    # CSS is already hashed into the PDF identifier by content.
+    fingerprint: list[tuple[str, int, int]] = []
+    stack = [str(template_folder)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif not entry.name.endswith(".css") and entry.is_file():
+                    st = entry.stat()
+                    fingerprint.append((entry.path, st.st_mtime_ns, st.st_size))
+    fingerprint.sort()
+    return tuple(fingerprint)
+
+
+def _render_cache_key(pdf_identifier: bytes, template_folder: Path) -> bytes:
+    """
+    Disk cache key for a render: the PDF identifier plus everything else that shapes the
+    output but is not part of it (non-CSS template assets and the WeasyPrint version).
+    """
+    import weasyprint
+
+    hasher = hashlib.sha256(pdf_identifier)
+    hasher.update(b"\0")
+    hasher.update(weasyprint.__version__.encode())
+    for path, mtime_ns, size in _template_asset_fingerprint(template_folder):
+        hasher.update(f"\0{path}\0{mtime_ns}\0{size}".encode())
+    return hasher.digest()[:16]
+
+
+@overload
 def render_pdf(
     snapshot: Snapshot,
     template_name: str,
@@ -85,12 +226,57 @@ def render_pdf(
     locale: str = "de_DE",
     timezone: str = "Europe/Berlin",
     templates_root: Path | None = None,
-) -> bytes:
+    cache_dir: Path | None = None,
+    cache_max_bytes: int = 0,
+    bytecode_cache_dir: Path | None = None,
+    templates_auto_reload: bool = True,
+    out: None = None,
+) -> bytes: ...
+
+
+@overload
+def render_pdf(
+    snapshot: Snapshot,
+    template_name: str,
+    *,
+    max_articles: int = 250,
+    locale: str = "de_DE",
+    timezone: str = "Europe/Berlin",
+    templates_root: Path | None = None,
+    cache_dir: Path | None = None,
+    cache_max_bytes: int = 0,
+    bytecode_cache_dir: Path | None = None,
+    templates_auto_reload: bool = True,
+    out: BinaryIO,
+) -> None: ...
+
+
+def render_pdf(
+    snapshot: Snapshot,
+    template_name: str,
+    *,
+    max_articles: int = 250,
+    locale: str = "de_DE",
+    timezone: str = "Europe/Berlin",
+    templates_root: Path | None = None,
+    cache_dir: Path | None = None,
+    cache_max_bytes: int = 0,
+    bytecode_cache_dir: Path | None = None,
+    templates_auto_reload: bool = True,
+    out: BinaryIO | None = None,
+) -> bytes | None:
     """
     Render a Snapshot to PDF bytes using:
       - Jinja2 templates/<template_name>/ticket.html
       - WeasyPrint HTML -> PDF
       - CSS loaded from the template folder
+
+    With out given, the PDF is streamed into that binary sink (WeasyPrint's write target)
+    instead of being returned, saving a full-size copy for callers writing to a file.
+
+    With cache_dir set, PDFs are cached on disk keyed by the PDF identifier (hash of HTML +
+    CSS), the template's other assets and the WeasyPrint version, so re-rendering an
+    unchanged snapshot skips WeasyPrint entirely.
     """
     if max_articles < 0:
         raise ValueError("max_articles must be >= 0")
@@ -100,41 +286,64 @@ def render_pdf(
             f"snapshot has too many articles ({len(snapshot.articles)} > {max_articles})"
         )
 
-    with _template_folder_path(template_name, templates_root=templates_root) as template_folder:
-        html = render_html(
-            snapshot,
-            template_name,
-            locale=locale,
-            timezone=timezone,
-            templates_root=templates_root,
+    template_folder = _template_folder_path(template_name, templates_root=templates_root)
+    html = render_html_bytes(
+        snapshot,
+        template_name,
+        locale=locale,
+        timezone=timezone,
+        templates_root=templates_root,
+        bytecode_cache_dir=bytecode_cache_dir,
+        auto_reload=templates_auto_reload,
+    )
+
+    assets = _template_assets(template_folder)
+    pdf_identifier = _pdf_identifier(html, assets.css_bytes)
+
+    cache_key = b""
+    if cache_dir is not None:
+        cache_key = _render_cache_key(pdf_identifier, template_folder)
+        cached = read_cached_pdf(cache_dir, cache_key)
+        if cached is not None:
+            return _deliver(cached, out)
+
+    # Import lazily so the rest of the codebase can be imported without the
+    # WeasyPrint native dependencies.
+    from weasyprint import HTML
+
+    # Temporary compatibility shim for WeasyPrint/pydyf version skew:
+    # pydyf emits a deprecation warning from internals we don't control.
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore",
+            message=(
+                "PDF objects don’t take version or identifier during initialization anymore.*"
+            ),
+            category=DeprecationWarning,
         )
+        html_doc = HTML(
+            string=html,
+            encoding="utf-8",
+            base_url=str(template_folder),
+            url_fetcher=_safe_url_fetcher(template_folder),
+        )
+        # The cache needs the bytes, so only stream straight to out when it is disabled.
+        target = out if cache_dir is None else None
+        pdf_bytes = html_doc.write_pdf(
+            target=target,
+            stylesheets=list(assets.stylesheets),
+            pdf_identifier=pdf_identifier,
+        )
+
+    if target is not None:
+        return None
+    if cache_dir is not None:
+        store_cached_pdf(cache_dir, cache_key, pdf_bytes, max_bytes=cache_max_bytes)
+    return _deliver(pdf_bytes, out)
+
 
-        css_paths = _css_file_paths(template_folder)
-        css_bytes = b"".join(p.read_bytes() for p in css_paths)
-        pdf_identifier = hashlib.sha256(html.encode("utf-8") + b"\0" + css_bytes).digest()[:16]
-
-        # Import lazily so the rest of the codebase can be imported without the
-        # WeasyPrint native dependencies.
-        from weasyprint import CSS, HTML  # type: ignore[import-untyped]
-
-        stylesheets = [CSS(filename=str(path)) for path in css_paths]
-
-        # Temporary compatibility shim for WeasyPrint/pydyf version skew:
-        # pydyf emits a deprecation warning from internals we don't control.
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore",
-                message=(
-                    "PDF objects don’t take version or identifier during initialization anymore.*"
-                ),
-                category=DeprecationWarning,
-            )
-            html_doc = HTML(
-                string=html,
-                base_url=str(template_folder),
-                url_fetcher=_safe_url_fetcher(template_folder),
-            )
-            return html_doc.write_pdf(
-                stylesheets=stylesheets,
-                pdf_identifier=pdf_identifier,
-            )
+def _deliver(pdf_bytes: bytes, out: BinaryIO | None) -> bytes | None:
+    if out is None:
+        return pdf_bytes
+    out.write(pdf_bytes)
+    return None
@@ -0,0 +1,47 @@
+"""Render PDFs in the shared worker pool (see adapters.worker_pool)."""
+
+from __future__ import annotations
+
+from functools import partial
+from pathlib import Path
+
+from zammad_pdf_archiver.adapters.pdf.render_pdf import render_pdf
+from zammad_pdf_archiver.adapters.worker_pool import run_in_worker_pool
+from zammad_pdf_archiver.domain.snapshot_models import Snapshot
+
+
+async def render_pdf_async(
+    snapshot: Snapshot,
+    template_name: str,
+    *,
+    worker_processes: int = 0,
+    max_articles: int = 250,
+    locale: str = "de_DE",
+    timezone: str = "Europe/Berlin",
+    templates_root: Path | None = None,
+    cache_dir: Path | None = None,
+    cache_max_bytes: int = 0,
+    bytecode_cache_dir: Path | None = None,
+    templates_auto_reload: bool = True,
+) -> bytes:
+    """
+    Render a snapshot, in a worker process when configured.
+
+    worker_processes=0 renders inline in this process (same as calling render_pdf); > 0 uses
+    a persistent process pool whose workers keep WeasyPrint imported between renders, so
+    neither the import nor the render runs on the event loop.
+    """
+    job = partial(
+        render_pdf,
+        snapshot,
+        template_name,
+        max_articles=max_articles,
+        locale=locale,
+        timezone=timezone,
+        templates_root=templates_root,
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_bytes,
+        bytecode_cache_dir=bytecode_cache_dir,
+        templates_auto_reload=templates_auto_reload,
+    )
+    return await run_in_worker_pool(worker_processes, job)
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import io
+import re
+from collections.abc import Callable
+from datetime import datetime
+from functools import cache, lru_cache
+from importlib import resources
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
 from jinja2 import (
+    BytecodeCache,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
+    Template,
     pass_context,
     select_autoescape,
 )
@@ -17,6 +25,9 @@ from jinja2.loaders import BaseLoader
 from zammad_pdf_archiver.domain.snapshot_models import Snapshot
 
 _TEMPLATE_FILE = "ticket.html"
+_DEFAULT_DT_FORMAT = "%Y-%m-%d %H:%M"
+# Path separators or traversal in a template name; one scan instead of three `in` checks.
+_UNSAFE_TEMPLATE_NAME_RE = re.compile(r"[/\\]|\.\.")
 
 ALLOWED_TEMPLATE_NAMES: frozenset[str] = frozenset({"default", "minimal", "compact"})
 
@@ -26,12 +37,15 @@ def validate_template_name(template_name: str) -> str:
     Validate and normalize template name. Raises ValueError if empty, contains path
     separators/traversal, or is not in allowlist (Bug #38). Returns stripped name.
     """
+    # Fast path: canonical names need no normalization (literals are already interned).
+    if type(template_name) is str and template_name in ALLOWED_TEMPLATE_NAMES:
+        return template_name
     if not isinstance(template_name, str):
         raise ValueError("template_name must be a string")
     name = template_name.strip()
     if not name:
         raise ValueError("template_name must be a non-empty string")
-    if "/" in name or "\\" in name or ".." in name:
+    if _UNSAFE_TEMPLATE_NAME_RE.search(name):
         raise ValueError("template_name must not contain path separators or '..'")
     if name not in ALLOWED_TEMPLATE_NAMES:
         raise ValueError(
@@ -40,8 +54,56 @@ def validate_template_name(template_name: str) -> str:
     return name
 
 
-@lru_cache(maxsize=32)
-def _env_for(template_name: str, templates_root: Path | None = None) -> Environment:
+_EnvKey = tuple[str, Path | None, Path | None, bool]
+HtmlRenderer = Callable[[Snapshot], bytes]
+
+# Plain dict instead of lru_cache: a hit is one dict lookup, no lock or key wrapping. The
+# key space is bounded by the template allowlist and the (static) settings.
+_ENVS: dict[_EnvKey, Environment] = {}
+# Resolved ticket templates for environments that never reload.
+_TEMPLATES: dict[_EnvKey, Template] = {}
+# Specialized renderers from make_html_renderer, keyed by env key plus (locale, timezone).
+_RENDERERS: dict[tuple[str, Path | None, Path | None, bool, str, str], HtmlRenderer] = {}
+
+
+def _env_for(
+    template_name: str,
+    templates_root: Path | None = None,
+    bytecode_cache_dir: Path | None = None,
+    auto_reload: bool = True,
+) -> Environment:
+    key = (template_name, templates_root, bytecode_cache_dir, auto_reload)
+    env = _ENVS.get(key)
+    if env is None:
+        env = _build_env(template_name, templates_root, bytecode_cache_dir, auto_reload)
+        _ENVS[key] = env
+    return env
+
+
+def _get_template(
+    template_name: str,
+    templates_root: Path | None,
+    bytecode_cache_dir: Path | None,
+    auto_reload: bool,
+) -> Template:
+    key = (template_name, templates_root, bytecode_cache_dir, auto_reload)
+    template = _TEMPLATES.get(key)
+    if template is not None:
+        return template
+    env = _env_for(*key)
+    template = env.get_template(f"{template_name}/{_TEMPLATE_FILE}")
+    # With auto_reload on, get_template must run per render so edits are noticed.
+    if not env.auto_reload:
+        _TEMPLATES[key] = template
+    return template
+
+
+def _build_env(
+    template_name: str,
+    templates_root: Path | None,
+    bytecode_cache_dir: Path | None,
+    auto_reload: bool,
+) -> Environment:
     template_name = validate_template_name(template_name)
 
     loader = _loader_for(template_name, templates_root=templates_root)
@@ -49,13 +111,51 @@ def _env_for(template_name: str, templates_root: Path | None = None) -> Environm
     env = Environment(
         loader=loader,
         autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=_bytecode_cache(bytecode_cache_dir),
+        # Packaged templates cannot change at runtime; a custom root reloads edits unless
+        # disabled, which saves a stat() per render (template edits then need a restart).
+        auto_reload=auto_reload and templates_root is not None,
+        # Keep every parsed template resident; the working set is a handful of files.
+        cache_size=-1,
     )
     _register_filters(env)
     return env
 
 
+@lru_cache(maxsize=4)
+def _bytecode_cache(directory: Path | None) -> BytecodeCache | None:
+    """
+    On-disk cache of compiled template bytecode, shared across processes and restarts.
+
+    Jinja validates entries against the template source checksum, so stale bytecode is never
+    used. An unusable directory only disables the cache.
+    """
+    if directory is None:
+        return None
+    path = directory.expanduser()
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory=str(path), pattern="%s.cache")
+
+
+@cache
+def _packaged_templates_root() -> Path | None:
+    """
+    Filesystem directory of the packaged templates, or None for zipped installs.
+
+    A plain FileSystemLoader skips PackageLoader's per-construction package introspection.
+    """
+    root = resources.files("zammad_pdf_archiver").joinpath("templates")
+    return root if isinstance(root, Path) and root.is_dir() else None
+
+
 def _loader_for(template_name: str, templates_root: Path | None) -> BaseLoader:
     if templates_root is None:
+        packaged_root = _packaged_templates_root()
+        if packaged_root is not None:
+            return FileSystemLoader(str(packaged_root))
         return PackageLoader("zammad_pdf_archiver", "templates")
 
     if not templates_root.exists() or not templates_root.is_dir():
@@ -66,28 +166,35 @@ def _loader_for(template_name: str, templates_root: Path | None) -> BaseLoader:
     return FileSystemLoader(str(templates_root))
 
 
+def _format_dt(value: Any, tz_name: str = "UTC") -> str:
+    return _format_datetime(value, tz_name=tz_name, fmt=_DEFAULT_DT_FORMAT)
+
+
+@pass_context
+def _format_dt_local(context: Any, value: Any, fmt: str = _DEFAULT_DT_FORMAT) -> str:
+    tz_name = context.get("pdf_timezone", "UTC")
+    return _format_datetime(value, tz_name=tz_name, fmt=fmt)
+
+
 def _register_filters(env: Environment) -> None:
-    def format_dt(value: Any, tz_name: str = "UTC") -> str:
-        return _format_datetime(value, tz_name=tz_name, fmt="%Y-%m-%d %H:%M")
+    env.filters.update(format_dt=_format_dt, format_dt_local=_format_dt_local)
 
-    @pass_context
-    def format_dt_local(context: Any, value: Any, fmt: str = "%Y-%m-%d %H:%M") -> str:
-        tz_name = context.get("pdf_timezone", "UTC")
-        return _format_datetime(value, tz_name=tz_name, fmt=fmt)
 
-    env.filters["format_dt"] = format_dt
-    env.filters["format_dt_local"] = format_dt_local
+@cache
+def _zone(tz_name: str) -> ZoneInfo:
+    # Filters run once per article timestamp; skip ZoneInfo's constructor/cache probing.
+    # Unknown names raise and are not cached, so the fallback below still applies.
+    return ZoneInfo(tz_name)
 
 
 def _format_datetime(value: Any, *, tz_name: str, fmt: str) -> str:
-    if not value or not hasattr(value, "strftime"):
+    # Snapshot timestamps are exact datetimes; skip the duck-typing probe for them.
+    if type(value) is not datetime and (not value or not hasattr(value, "strftime")):
         return str(value) if value is not None else "—"
     try:
-        target_tz = ZoneInfo(tz_name)
-        localized = value.astimezone(target_tz)
-        return localized.strftime(fmt)
+        return value.astimezone(_zone(tz_name)).strftime(fmt)
     except Exception:
-        return value.strftime(fmt) if hasattr(value, "strftime") else str(value)
+        return value.strftime(fmt)
 
 
 def render_html(
@@ -97,6 +204,8 @@ def render_html(
     locale: str = "de_DE",
     timezone: str = "Europe/Berlin",
     templates_root: Path | None = None,
+    bytecode_cache_dir: Path | None = None,
+    auto_reload: bool = True,
 ) -> str:
     """
     Render a Snapshot to HTML using templates/<template_name>/ticket.html.
@@ -104,12 +213,77 @@ def render_html(
     Jinja context is restricted to a minimal whitelist (Bug #39): only snapshot,
     ticket, and articles are passed; no config, request, or full object graph.
     """
-    env = _env_for(template_name, templates_root=templates_root)
-    template = env.get_template(f"{template_name}/{_TEMPLATE_FILE}")
-    return template.render(
-        snapshot=snapshot,
-        ticket=snapshot.ticket,
-        articles=snapshot.articles,
-        pdf_locale=locale,
-        pdf_timezone=timezone,
-    )
+    template = _get_template(template_name, templates_root, bytecode_cache_dir, auto_reload)
+    return template.render(_template_context(snapshot, locale=locale, timezone=timezone))
+
+
+def render_html_bytes(
+    snapshot: Snapshot,
+    template_name: str,
+    *,
+    locale: str = "de_DE",
+    timezone: str = "Europe/Berlin",
+    templates_root: Path | None = None,
+    bytecode_cache_dir: Path | None = None,
+    auto_reload: bool = True,
+) -> bytes:
+    """
+    Like render_html, but streams the output UTF-8 encoded into one buffer.
+
+    Avoids holding the full HTML str and its encoded copy at the same time for large tickets.
+    """
+    return make_html_renderer(
+        template_name,
+        locale=locale,
+        timezone=timezone,
+        templates_root=templates_root,
+        bytecode_cache_dir=bytecode_cache_dir,
+        auto_reload=auto_reload,
+    )(snapshot)
+
+
+def make_html_renderer(
+    template_name: str,
+    *,
+    locale: str = "de_DE",
+    timezone: str = "Europe/Berlin",
+    templates_root: Path | None = None,
+    bytecode_cache_dir: Path | None = None,
+    auto_reload: bool = True,
+) -> HtmlRenderer:
+    """
+    Return a snapshot -> UTF-8 HTML renderer specialized for one template/locale/timezone.
+
+    The template (unless it auto-reloads) and the constant context entries are bound once,
+    so batch callers pay only for the per-ticket context and the render itself.
+    """
+    key = (template_name, templates_root, bytecode_cache_dir, auto_reload, locale, timezone)
+    renderer = _RENDERERS.get(key)
+    if renderer is not None:
+        return renderer
+
+    env_key: _EnvKey = (template_name, templates_root, bytecode_cache_dir, auto_reload)
+    template = _get_template(*env_key)
+    reloads = _env_for(*env_key).auto_reload
+    constants = _constant_context(locale=locale, timezone=timezone)
+
+    def _render(snapshot: Snapshot) -> bytes:
+        tmpl = _get_template(*env_key) if reloads else template
+        buf = io.BytesIO()
+        tmpl.stream({**constants, **_snapshot_context(snapshot)}).dump(buf, encoding="utf-8")
+        return buf.getvalue()
+
+    _RENDERERS[key] = _render
+    return _render
+
+
+def _template_context(snapshot: Snapshot, *, locale: str, timezone: str) -> dict[str, Any]:
+    return {**_constant_context(locale=locale, timezone=timezone), **_snapshot_context(snapshot)}
+
+
+def _constant_context(*, locale: str, timezone: str) -> dict[str, Any]:
+    return {"pdf_locale": locale, "pdf_timezone": timezone}
+
+
+def _snapshot_context(snapshot: Snapshot) -> dict[str, Any]:
+    return {"snapshot": snapshot, "ticket": snapshot.ticket, "articles": snapshot.articles}
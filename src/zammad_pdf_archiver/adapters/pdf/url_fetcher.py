@@ -2,47 +2,92 @@
 
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 from urllib.parse import unquote, urlparse
 
+# Per-render cache of fetched file bodies: a logo referenced by every article is read once.
+_MAX_CACHED_FILES = 64
+# Larger assets (fonts, photos) are streamed from an open file and never held in the cache.
+_MAX_CACHED_BODY_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=32)
+def _resolved_root(template_root: Path) -> Path:
+    return template_root.resolve()
+
 
 class _SafeURLFetcher:
     """WeasyPrint-compatible fetcher: only data: and file under template_root."""
 
     def __init__(self, template_root: Path) -> None:
-        self._root = template_root.resolve()
+        self._root = _resolved_root(template_root)
+        self._root_str = str(self._root)
+        # Prefix for descendants; the filesystem root already ends with a separator.
+        self._root_prefix = self._root_str.rstrip(os.sep) + os.sep
+        self._bodies: OrderedDict[str, bytes] = OrderedDict()
+        self._fatal_error: Any = None
+        self._response: Any = None
+        self._data_fetcher: Any = None
 
-    def fetch(self, url: str, headers=None):
+    def _bind_weasyprint(self) -> None:
+        # Bound on the first fetch instead of re-importing on every fetch; building the
+        # fetcher itself (once per render, cache hits included) imports nothing.
+        if self._fatal_error is not None:
+            return
         from weasyprint.urls import (  # type: ignore[import-untyped]
             FatalURLFetchingError,
             URLFetcher,
             URLFetcherResponse,
         )
 
+        self._fatal_error = FatalURLFetchingError
+        self._response = URLFetcherResponse
+        self._data_fetcher = URLFetcher(allowed_protocols=("data",))
+
+    def fetch(self, url: str, headers=None):
+        self._bind_weasyprint()
         parsed = urlparse(url)
         scheme = (parsed.scheme or "").lower()
         if scheme == "data":
-            return URLFetcher(allowed_protocols=("data",)).fetch(url, headers)
+            return self._data_fetcher.fetch(url, headers)
         if scheme == "file":
-            path = Path(unquote(parsed.path))
-            if not path.is_absolute():
-                path = (self._root / path).resolve()
-            else:
-                path = path.resolve()
-            try:
-                if self._root not in path.parents and path != self._root:
-                    raise FatalURLFetchingError(
-                        f"file URL outside template root: {url!r}"
-                    )
-                if not path.is_file():
-                    raise FatalURLFetchingError(f"file URL not a file: {url!r}")
-            except FatalURLFetchingError:
-                raise
-            except Exception as e:
-                raise FatalURLFetchingError(f"invalid file URL: {url!r}") from e
-            body = path.read_bytes()
-            return URLFetcherResponse(url=url, body=body, status=200)
-        raise FatalURLFetchingError(f"URL scheme not allowed: {scheme!r}")
+            return self._fetch_file(url, parsed.path)
+        raise self._fatal_error(f"URL scheme not allowed: {scheme!r}")
+
+    def _fetch_file(self, url: str, url_path: str):
+        body = self._bodies.get(url)
+        if body is not None:
+            self._bodies.move_to_end(url)
+            return self._response(url=url, body=body, status=200)
+        path = Path(unquote(url_path))
+        if not path.is_absolute():
+            path = (self._root / path).resolve()
+        else:
+            path = path.resolve()
+        try:
+            spath = str(path)
+            # Plain string prefix test on the resolved path; no parents walk.
+            if spath != self._root_str and not spath.startswith(self._root_prefix):
+                raise self._fatal_error(f"file URL outside template root: {url!r}")
+            if not path.is_file():
+                raise self._fatal_error(f"file URL not a file: {url!r}")
+            size = path.stat().st_size
+        except self._fatal_error:
+            raise
+        except Exception as e:
+            raise self._fatal_error(f"invalid file URL: {url!r}") from e
+        if size > _MAX_CACHED_BODY_BYTES:
+            # WeasyPrint reads and closes file-object bodies itself.
+            return self._response(url=url, body=path.open("rb"), status=200)
+        body = path.read_bytes()
+        self._bodies[url] = body
+        if len(self._bodies) > _MAX_CACHED_FILES:
+            self._bodies.popitem(last=False)
+        return self._response(url=url, body=body, status=200)
 
     def __call__(self, url: str, *args, **kwargs):
         headers = kwargs.get("headers") or kwargs.get("http_headers")
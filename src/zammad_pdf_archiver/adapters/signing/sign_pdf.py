@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -12,10 +14,23 @@ from zammad_pdf_archiver.domain.errors import PermanentError, TransientError
 @dataclass(frozen=True)
 class _PfxMaterial:
     path: Path
-    pfx_bytes: bytes
     password: bytes | None
 
 
+@dataclass(frozen=True)
+class _CachedSigner:
+    signer: Any
+    not_before: datetime
+    not_after: datetime
+
+
+# Loaded signers keyed by (path, mtime_ns, size, password digest): the PFX is parsed once per
+# process and reloaded automatically when the file is replaced.
+_SIGNER_CACHE: dict[tuple[str, int, int, bytes], _CachedSigner] = {}
+_SIGNER_CACHE_MAX = 4
+_signer_lock = threading.Lock()
+
+
 def _secret_to_str(value: Any) -> str | None:
     if value is None:
         return None
@@ -42,32 +57,40 @@ def _load_pfx(settings: Any) -> _PfxMaterial:
 
     password_str = _secret_to_str(getattr(signing, "pfx_password", None))
     password = password_str.encode("utf-8") if password_str else None
-    return _PfxMaterial(path=path, pfx_bytes=path.read_bytes(), password=password)
+    return _PfxMaterial(path=path, password=password)
+
 
+def _validate_cert_not_expired(pfx_bytes: bytes, password: bytes | None) -> Any:
+    """
+    Parse the PKCS#12 bundle and check the certificate validity window.
 
-def _validate_cert_not_expired(pfx_bytes: bytes, password: bytes | None) -> None:
+    Returns the parsed bundle; the key stays a cryptography object until _simple_signer
+    converts it, so an expired certificate fails before any key serialization.
+    """
     # Import lazily to keep non-signing code paths importable without crypto deps.
     from cryptography.hazmat.primitives.serialization import pkcs12
 
     try:
-        key, cert, _extra = pkcs12.load_key_and_certificates(pfx_bytes, password)
+        bundle = pkcs12.load_pkcs12(pfx_bytes, password)
     except ValueError as exc:
         hint = "wrong password" if password else "missing/incorrect password"
         raise PermanentError(
             f"Failed to load PKCS#12/PFX bundle ({hint} or corrupted file)"
         ) from exc
 
-    if key is None or cert is None:
+    if bundle.key is None or bundle.cert is None:
         raise PermanentError("PKCS#12/PFX bundle must contain a private key and certificate")
 
-    now = datetime.now(UTC)
-    not_before = getattr(cert, "not_valid_before_utc", None) or cert.not_valid_before.replace(
-        tzinfo=UTC
-    )
-    not_after = getattr(cert, "not_valid_after_utc", None) or cert.not_valid_after.replace(
-        tzinfo=UTC
-    )
+    _check_validity_window(*_validity_window(bundle.cert.certificate))
+    return bundle
+
 
+def _validity_window(cert: Any) -> tuple[datetime, datetime]:
+    return cert.not_valid_before_utc, cert.not_valid_after_utc
+
+
+def _check_validity_window(not_before: datetime, not_after: datetime) -> None:
+    now = datetime.now(UTC)
     if now < not_before:
         raise PermanentError(
             f"Signing certificate is not valid before {not_before.isoformat()}"
@@ -76,6 +99,59 @@ def _validate_cert_not_expired(pfx_bytes: bytes, password: bytes | None) -> None
         raise PermanentError(f"Signing certificate expired on {not_after.isoformat()}")
 
 
+def _cached_signer(pfx: _PfxMaterial) -> Any:
+    st = pfx.path.stat()
+    cache_key = (
+        str(pfx.path),
+        st.st_mtime_ns,
+        st.st_size,
+        hashlib.sha256(pfx.password or b"").digest(),
+    )
+    with _signer_lock:
+        cached = _SIGNER_CACHE.get(cache_key)
+    if cached is not None:
+        # The certificate can expire while the process runs; re-check on every use.
+        _check_validity_window(cached.not_before, cached.not_after)
+        return cached.signer
+
+    bundle = _validate_cert_not_expired(pfx.path.read_bytes(), pfx.password)
+    try:
+        signer = _simple_signer(bundle)
+    except Exception as exc:  # noqa: BLE001 - surface as PermanentError with context
+        raise PermanentError("Failed to initialise signer from PKCS#12/PFX bundle") from exc
+    not_before, not_after = _validity_window(bundle.cert.certificate)
+    cached = _CachedSigner(signer=signer, not_before=not_before, not_after=not_after)
+    with _signer_lock:
+        if len(_SIGNER_CACHE) >= _SIGNER_CACHE_MAX:
+            _SIGNER_CACHE.clear()
+        _SIGNER_CACHE[cache_key] = cached
+    return signer
+
+
+def _simple_signer(bundle: Any) -> Any:
+    """Build a pyHanko SimpleSigner from an already parsed PKCS#12 bundle (no second parse)."""
+    from asn1crypto import keys, x509  # type: ignore[import-untyped]
+    from cryptography.hazmat.primitives import serialization
+    from pyhanko.sign import signers
+    from pyhanko_certvalidator.registry import SimpleCertificateStore
+
+    def _cert(value: Any) -> Any:
+        return x509.Certificate.load(value.public_bytes(serialization.Encoding.DER))
+
+    key_info = keys.PrivateKeyInfo.load(
+        bundle.key.private_bytes(
+            serialization.Encoding.DER,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    registry = SimpleCertificateStore()
+    registry.register_multiple({_cert(c.certificate) for c in bundle.additional_certs})
+    return signers.SimpleSigner(
+        signing_key=key_info, signing_cert=_cert(bundle.cert.certificate), cert_registry=registry
+    )
+
+
 def sign_pdf(pdf_bytes: bytes, settings: Any) -> bytes:
     """
     Sign a PDF with an (invisible) PAdES signature using a locally provided PKCS#12/PFX bundle.
@@ -85,12 +161,10 @@ def sign_pdf(pdf_bytes: bytes, settings: Any) -> bytes:
     if not isinstance(pdf_bytes, (bytes, bytearray)) or not pdf_bytes:
         raise ValueError("pdf_bytes must be non-empty bytes")
 
-    pfx = _load_pfx(settings)
-    _validate_cert_not_expired(pfx.pfx_bytes, pfx.password)
+    signer = _cached_signer(_load_pfx(settings))
 
     # Import lazily so the rest of the service stays importable even if pyHanko isn't installed.
     from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
-    from pyhanko.sign import signers
     from pyhanko.sign.fields import SigFieldSpec
     from pyhanko.sign.signers.pdf_signer import PdfSignatureMetadata, PdfSigner
 
@@ -102,11 +176,6 @@ def sign_pdf(pdf_bytes: bytes, settings: Any) -> bytes:
         reason = getattr(pades, "reason", None)
         location = getattr(pades, "location", None)
 
-    try:
-        signer = signers.SimpleSigner.load_pkcs12(pfx.path, passphrase=pfx.password)
-    except Exception as exc:  # noqa: BLE001 - surface as PermanentError with context
-        raise PermanentError("Failed to initialise signer from PKCS#12/PFX bundle") from exc
-
     field_name = "Signature1"
     meta = PdfSignatureMetadata(field_name=field_name, reason=reason, location=location)
 
@@ -133,7 +202,9 @@ def sign_pdf(pdf_bytes: bytes, settings: Any) -> bytes:
 
     out = io.BytesIO()
     try:
-        writer = IncrementalPdfFileWriter(io.BytesIO(bytes(pdf_bytes)))
+        # BytesIO shares an immutable bytes buffer until written to; a bytearray is copied
+        # once here either way, so no bytes() conversion up front.
+        writer = IncrementalPdfFileWriter(io.BytesIO(pdf_bytes))
         pdf_signer.sign_pdf(writer, output=out)
     except (TransientError, PermanentError):
         raise
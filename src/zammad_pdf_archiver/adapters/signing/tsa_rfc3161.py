@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -86,6 +88,40 @@ def _load_tsa_config(settings: Any) -> _TsaConfig:
     )
 
 
+# One pooled client per TSA config for the process lifetime. pyHanko drives the async
+# timestamper from a fresh event loop per signature, so an AsyncClient (bound to its loop)
+# could never be reused; a thread-safe sync Client keeps TLS connections alive across signs.
+_CLIENTS: dict[_TsaConfig, httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def _client_for(config: _TsaConfig) -> httpx.Client:
+    with _clients_lock:
+        client = _CLIENTS.get(config)
+        if client is None:
+            verify: bool | str = True
+            if config.ca_bundle_path is not None:
+                verify = str(config.ca_bundle_path)
+            client = httpx.Client(
+                timeout=timeouts_for(config.timeout_seconds),
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=1),
+                verify=verify,
+                trust_env=config.trust_env,
+                follow_redirects=False,
+            )
+            _CLIENTS[config] = client
+        return client
+
+
+def close_tsa_clients() -> None:
+    """Close pooled TSA clients (app shutdown; tests)."""
+    with _clients_lock:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
 class _HttpxRFC3161TimeStamper(TimeStamper):
     def __init__(self, config: _TsaConfig):
         super().__init__()
@@ -93,27 +129,19 @@ class _HttpxRFC3161TimeStamper(TimeStamper):
 
     async def async_request_tsa_response(self, req: tsp.TimeStampReq) -> tsp.TimeStampResp:
         headers = set_tsp_headers({})
-        verify: bool | str = True
-        if self._config.ca_bundle_path is not None:
-            verify = str(self._config.ca_bundle_path)
 
         try:
             post_kwargs: dict[str, Any] = {}
             if self._config.auth is not None:
                 post_kwargs["auth"] = self._config.auth
-            async with httpx.AsyncClient(
-                timeout=timeouts_for(self._config.timeout_seconds),
-                limits=httpx.Limits(max_connections=2, max_keepalive_connections=1),
-                verify=verify,
-                trust_env=self._config.trust_env,
-                follow_redirects=False,
-            ) as client:
-                response = await client.post(
-                    self._config.url,
-                    content=req.dump(),
-                    headers=headers,
-                    **post_kwargs,
-                )
+            client = _client_for(self._config)
+            response = await asyncio.to_thread(
+                client.post,
+                self._config.url,
+                content=req.dump(),
+                headers=headers,
+                **post_kwargs,
+            )
         except httpx.RequestError as exc:
             raise TransientError("Error communicating with RFC3161 TSA") from exc
 
@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import re
-from collections.abc import Awaitable
 from datetime import UTC, datetime
+from functools import partial
 from html.parser import HTMLParser
 from typing import Any, Protocol
 
+from zammad_pdf_archiver.adapters.worker_pool import run_in_worker_pool
 from zammad_pdf_archiver.adapters.zammad.models import Article as ZammadArticle
 from zammad_pdf_archiver.adapters.zammad.models import TagList
 from zammad_pdf_archiver.adapters.zammad.models import Ticket as ZammadTicket
-from zammad_pdf_archiver.domain.html_sanitize import sanitize_html_fragment
+from zammad_pdf_archiver.domain.html_sanitize import (
+    normalize_text,
+    sanitize_html_fragment_with_text,
+)
 from zammad_pdf_archiver.domain.snapshot_models import (
     Article,
     AttachmentMeta,
@@ -20,10 +24,23 @@ from zammad_pdf_archiver.domain.snapshot_models import (
 )
 from zammad_pdf_archiver.domain.ticket_utils import ticket_custom_fields
 
+# Tags: a b blockquote br code div em i li ol p pre span strong table td th tr u ul,
+# factored by prefix so the engine tries fewer alternatives per '<'.
 _HTML_TAG_HINT_RE = re.compile(
-    r"<\s*(?:p|div|br|span|a|ul|ol|li|pre|code|blockquote|table|tr|td|th|strong|em|b|i|u)\b",
+    r"<\s*(?:a|b(?:lockquote|r)?|code|div|em|i|li|ol|p(?:re)?|s(?:pan|trong)|t(?:able|[dhr])|ul?)\b",
     re.IGNORECASE,
 )
+_html_tag_hint_search = _HTML_TAG_HINT_RE.search
+
+
+# Sorts undated articles last; built once instead of per key call.
+_UNDATED_SORT_DT = datetime.max.replace(tzinfo=UTC)
+
+# Concurrent attachment downloads; matches AsyncZammadClient's connection pool size.
+_ATTACHMENT_FETCH_CONCURRENCY = 10
+
+# Minimum article count before conversion is spread over worker processes.
+_PARALLEL_ARTICLES_MIN = 16
 
 
 class ZammadSnapshotClient(Protocol):
@@ -38,8 +55,13 @@ class ZammadAttachmentClient(Protocol):
     """Client that can fetch attachment binary (for optional PRD §8.2 inclusion)."""
 
     async def get_attachment_content(
-        self, ticket_id: int, article_id: int, attachment_id: int
-    ) -> bytes: ...
+        self,
+        ticket_id: int,
+        article_id: int,
+        attachment_id: int,
+        *,
+        max_bytes: int | None = None,
+    ) -> bytes | None: ...
 
 
 class _HTMLToText(HTMLParser):
@@ -67,11 +89,7 @@ class _HTMLToText(HTMLParser):
             self._parts.append(data)
 
     def get_text(self) -> str:
-        text = "".join(self._parts)
-        # Normalize whitespace without being too opinionated about newlines.
-        text = "\n".join(line.strip() for line in text.splitlines())
-        text = "\n".join(line for line in text.splitlines() if line)
-        return text.strip()
+        return normalize_text("".join(self._parts))
 
 
 def _strip_html_to_text(html: str) -> str:
@@ -88,7 +106,9 @@ def _has_html_hint(*, content_type: str | None, body: str) -> bool:
     if content_type and "html" in content_type.lower():
         return True
     # Heuristic: only treat bodies as HTML if they look like common HTML tags.
-    return bool(_HTML_TAG_HINT_RE.search(body))
+    if "<" not in body:
+        return False
+    return _html_tag_hint_search(body) is not None
 
 
 def _party_from_zammad_ref(ref: Any) -> PartyRef | None:
@@ -109,10 +129,8 @@ def _article_to_snapshot(article: ZammadArticle) -> Article:
 
     if body_raw:
         if _has_html_hint(content_type=article.content_type, body=body_raw):
-            body_html = sanitize_html_fragment(body_raw)
-            if body_html:
-                body_text = _strip_html_to_text(body_html)
-            else:
+            body_html, body_text = sanitize_html_fragment_with_text(body_raw)
+            if not body_html:
                 # Bug #P1-1: If sanitization failed, never fallback to raw body as HTML.
                 # Fallback to stripped text from raw for body_text; body_html stays empty.
                 body_text = _strip_html_to_text(body_raw)
@@ -151,12 +169,35 @@ def _article_to_snapshot(article: ZammadArticle) -> Article:
 
 
 def _sort_key(article: Article) -> tuple[bool, datetime, int]:
-    sentinel = datetime.max.replace(tzinfo=UTC)
     created = article.created_at
-    if created is not None and created.tzinfo is None:
+    if created is None:
+        return (True, _UNDATED_SORT_DT, article.id)
+    if created.tzinfo is None:
         created = created.replace(tzinfo=UTC)
-    created = created or sentinel
-    return (article.created_at is None, created, article.id)
+    return (False, created, article.id)
+
+
+def _convert_articles(articles: list[ZammadArticle]) -> list[Article]:
+    return [_article_to_snapshot(a) for a in articles]
+
+
+async def _convert_articles_async(
+    articles: list[ZammadArticle], *, worker_processes: int
+) -> list[Article]:
+    # Below the threshold, pickling articles to and from workers costs more than it saves.
+    if worker_processes <= 0 or len(articles) < _PARALLEL_ARTICLES_MIN:
+        return _convert_articles(articles)
+    chunk = -(-len(articles) // worker_processes)
+    jobs = [
+        partial(_convert_articles, articles[i : i + chunk])
+        for i in range(0, len(articles), chunk)
+    ]
+    batches = await asyncio.gather(*(run_in_worker_pool(worker_processes, j) for j in jobs))
+    return [article for batch in batches for article in batch]
+
+
+async def _given[T](value: T) -> T:
+    return value
 
 
 async def build_snapshot(
@@ -165,28 +206,35 @@ async def build_snapshot(
     *,
     ticket: ZammadTicket | None = None,
     tags: TagList | None = None,
+    worker_processes: int = 0,
 ) -> Snapshot:
-    if ticket is None:
-        ticket = await client.get_ticket(ticket_id)
-    if tags is None:
-        tags = await client.list_tags(ticket_id)
-
-    articles: list[ZammadArticle] = await client.list_articles(ticket_id)
+    """
+    Fetch a ticket with its tags and articles and convert them to a Snapshot.
+
+    worker_processes > 0 spreads article conversion (HTML sanitize + text extraction) of
+    long tickets over the shared worker pool; 0 converts inline.
+    """
+    # Fetch whatever is missing concurrently; the article list is usually the slowest call.
+    fetched_ticket, fetched_tags, articles = await asyncio.gather(
+        client.get_ticket(ticket_id) if ticket is None else _given(ticket),
+        client.list_tags(ticket_id) if tags is None else _given(tags),
+        client.list_articles(ticket_id),
+    )
 
-    snapshot_articles = [_article_to_snapshot(a) for a in articles]
+    snapshot_articles = await _convert_articles_async(articles, worker_processes=worker_processes)
     snapshot_articles.sort(key=_sort_key)
 
     return Snapshot(
         ticket=TicketMeta(
-            id=ticket.id,
-            number=ticket.number,
-            title=ticket.title,
-            created_at=ticket.created_at,
-            updated_at=ticket.updated_at,
-            customer=_party_from_zammad_ref(ticket.customer),
-            owner=_party_from_zammad_ref(ticket.owner),
-            tags=list(tags.root),
-            custom_fields=ticket_custom_fields(ticket),
+            id=fetched_ticket.id,
+            number=fetched_ticket.number,
+            title=fetched_ticket.title,
+            created_at=fetched_ticket.created_at,
+            updated_at=fetched_ticket.updated_at,
+            customer=_party_from_zammad_ref(fetched_ticket.customer),
+            owner=_party_from_zammad_ref(fetched_ticket.owner),
+            tags=list(fetched_tags.root),
+            custom_fields=ticket_custom_fields(fetched_ticket),
         ),
         articles=snapshot_articles,
     )
@@ -199,6 +247,7 @@ async def enrich_attachment_content(
     include_attachment_binary: bool,
     max_attachment_bytes_per_file: int,
     max_total_attachment_bytes: int,
+    max_concurrency: int = _ATTACHMENT_FETCH_CONCURRENCY,
 ) -> Snapshot:
     """Fetch attachment binaries and set AttachmentMeta.content when within limits (PRD §8.2)."""
     if not _attachment_enrichment_enabled(
@@ -208,36 +257,40 @@ async def enrich_attachment_content(
         return snapshot
 
     ticket_id = snapshot.ticket.id
-    semaphore = asyncio.Semaphore(5)  # Limit concurrency to avoid overloading Zammad
-
-    async def _fetch_one(
-        article_id: int, att: AttachmentMeta
-    ) -> tuple[int, int | None, bytes | None]:
-        if att.attachment_id is None:
-            return article_id, None, None
-
-        # Pre-check size if available to avoid useless downloads
-        if att.size is not None and att.size > max_attachment_bytes_per_file:
-            return article_id, att.attachment_id, None
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Filled as each download finishes, so nothing waits on the slowest one to be collected.
+    content_map: dict[tuple[int, int], bytes] = {}
 
+    async def _fetch_one(article_id: int, attachment_id: int) -> None:
         async with semaphore:
             try:
+                # Streams and aborts past the per-file cap instead of buffering the whole body.
                 raw = await client.get_attachment_content(
-                    ticket_id, article_id, att.attachment_id
+                    ticket_id,
+                    article_id,
+                    attachment_id,
+                    max_bytes=max_attachment_bytes_per_file,
                 )
-                if len(raw) > max_attachment_bytes_per_file:
-                    return article_id, att.attachment_id, None
-                return article_id, att.attachment_id, raw
             except Exception:
-                return article_id, att.attachment_id, None
-
-    targets = _attachment_fetch_targets(snapshot, fetch_one=_fetch_one)
-
+                return
+        if raw is not None and len(raw) <= max_attachment_bytes_per_file:
+            content_map[(article_id, attachment_id)] = raw
+
+    targets = [
+        (article.id, att.attachment_id)
+        for article in snapshot.articles
+        for att in article.attachments
+        if att.attachment_id is not None
+        # Pre-check size if available to avoid useless downloads
+        and (att.size is None or att.size <= max_attachment_bytes_per_file)
+    ]
     if not targets:
         return snapshot
 
-    results = await asyncio.gather(*targets)
-    content_map = _attachment_content_map(results)
+    async with asyncio.TaskGroup() as tg:
+        for article_id, attachment_id in targets:
+            tg.create_task(_fetch_one(article_id, attachment_id))
+
     return _snapshot_with_attachment_content(
         snapshot=snapshot,
         content_map=content_map,
@@ -253,39 +306,20 @@ def _attachment_enrichment_enabled(
     return include_attachment_binary and max_total_attachment_bytes > 0
 
 
-def _attachment_fetch_targets(
-    snapshot: Snapshot,
-    *,
-    fetch_one,
-) -> list[Awaitable[tuple[int, int | None, bytes | None]]]:
-    targets: list[Awaitable[tuple[int, int | None, bytes | None]]] = []
-    for article in snapshot.articles:
-        for att in article.attachments:
-            targets.append(fetch_one(article.id, att))
-    return targets
-
-
-def _attachment_content_map(
-    results: list[tuple[int, int | None, bytes | None]]
-) -> dict[tuple[int, int], bytes]:
-    out: dict[tuple[int, int], bytes] = {}
-    for article_id, attachment_id, content in results:
-        if attachment_id is None or content is None:
-            continue
-        out[(article_id, attachment_id)] = content
-    return out
-
-
 def _snapshot_with_attachment_content(
     *,
     snapshot: Snapshot,
     content_map: dict[tuple[int, int], bytes],
     max_total_attachment_bytes: int,
 ) -> Snapshot:
+    # Models are frozen: copy only attachments whose content changes, and only the articles
+    # holding them; everything else keeps its original object.
     total_so_far = 0
+    changed = False
     new_articles: list[Article] = []
     for article in snapshot.articles:
         new_attachments: list[AttachmentMeta] = []
+        article_changed = False
         for att in article.attachments:
             content, total_so_far = _bounded_content_for_attachment(
                 article_id=article.id,
@@ -294,8 +328,16 @@ def _snapshot_with_attachment_content(
                 total_so_far=total_so_far,
                 max_total_attachment_bytes=max_total_attachment_bytes,
             )
-            new_attachments.append(_copy_attachment(att, content=content))
-        new_articles.append(_copy_article(article, attachments=new_attachments))
+            if content is not att.content:
+                att = att.model_copy(update={"content": content})
+                article_changed = True
+            new_attachments.append(att)
+        if article_changed:
+            article = article.model_copy(update={"attachments": new_attachments})
+            changed = True
+        new_articles.append(article)
+    if not changed:
+        return snapshot
     return Snapshot(ticket=snapshot.ticket, articles=new_articles)
 
 
@@ -315,27 +357,3 @@ def _bounded_content_for_attachment(
     if total_so_far + len(content) > max_total_attachment_bytes:
         return None, total_so_far
     return content, total_so_far + len(content)
-
-
-def _copy_attachment(att: AttachmentMeta, *, content: bytes | None) -> AttachmentMeta:
-    return AttachmentMeta(
-        article_id=att.article_id,
-        attachment_id=att.attachment_id,
-        filename=att.filename,
-        size=att.size,
-        content_type=att.content_type,
-        content=content,
-    )
-
-
-def _copy_article(article: Article, *, attachments: list[AttachmentMeta]) -> Article:
-    return Article(
-        id=article.id,
-        created_at=article.created_at,
-        internal=article.internal,
-        sender=article.sender,
-        subject=article.subject,
-        body_html=article.body_html,
-        body_text=article.body_text,
-        attachments=attachments,
-    )
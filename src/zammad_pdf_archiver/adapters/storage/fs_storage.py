@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import errno
 import os
+import secrets
+import stat
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 from zammad_pdf_archiver.domain.path_policy import ensure_within_root
 
+# Linux-only open flag for unnamed temp inodes; 0 elsewhere disables that write path.
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
+
 
 def ensure_dir(path: Path) -> None:
-    Path(path).mkdir(parents=True, exist_ok=True)
+    path.mkdir(parents=True, exist_ok=True)
 
 
 def _fsync_dir_best_effort(dir_path: Path) -> None:
@@ -30,29 +37,29 @@ def _fsync_dir_best_effort(dir_path: Path) -> None:
         os.close(fd)
 
 
-def write_bytes(
-    target_path: Path, data: bytes, *, storage_root: Path, fsync: bool = True
-) -> None:
-    target = Path(target_path)
-    parent = target.parent
+def write_bytes(target_path: Path, data: bytes, *, storage_root: Path, fsync: bool = True) -> None:
+    parent = _write_bytes(target_path, data, storage_root=storage_root, fsync=fsync)
+    if fsync:
+        _fsync_dir_best_effort(parent)
+
+
+def _write_bytes(target_path: Path, data: bytes, *, storage_root: Path, fsync: bool) -> Path:
+    # Everything but the directory fsync; returns the directory to sync.
+    parent = target_path.parent
     # Bug #13/#20: validate path and symlinks before any directory creation.
-    ensure_within_root(storage_root, target)
+    ensure_within_root(storage_root, target_path)
     _reject_symlinks_under_root(storage_root, parent)
     ensure_dir(parent)
 
     flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
     flags |= getattr(os, "O_NOFOLLOW", 0)
-    fd = os.open(str(target), flags, 0o640)
-    with os.fdopen(fd, "wb") as f:
-        f.write(data)
-        f.flush()
-        # Bug #40: always set permissions (e.g. when overwriting existing file).
-        os.fchmod(f.fileno(), 0o640)
-        if fsync:
-            os.fsync(f.fileno())
-
-    if fsync:
-        _fsync_dir_best_effort(parent)
+    fd = os.open(target_path, flags, 0o640)
+    try:
+        # Bug #40: _write_fd always sets permissions (e.g. when overwriting existing file).
+        _write_fd(fd, data, fsync=fsync)
+    finally:
+        os.close(fd)
+    return parent
 
 
 def _reject_symlinks_under_root(root: Path, target_dir: Path) -> None:
@@ -60,8 +67,8 @@ def _reject_symlinks_under_root(root: Path, target_dir: Path) -> None:
     Reject target_dir if it traverses a symlink under root (best-effort).
     Note: TOCTOU race is possible (symlink created between check and write).
     """
-    root_resolved = Path(root).resolve(strict=False)
-    dir_resolved = Path(target_dir).resolve(strict=False)
+    root_resolved = _resolved_root(root)
+    dir_resolved = target_dir.resolve(strict=False)
     ensure_within_root(root_resolved, dir_resolved)
 
     try:
@@ -69,54 +76,108 @@ def _reject_symlinks_under_root(root: Path, target_dir: Path) -> None:
     except Exception as exc:  # pragma: no cover
         raise ValueError("target path escapes root") from exc
 
-    current = root_resolved
+    # One lstat per component. Validated directories are deliberately not memoized: a
+    # component swapped for a symlink later must still be caught on the next write.
+    current = str(root_resolved)
     for part in relative.parts:
-        current = current / part
+        current = os.path.join(current, part)
         try:
-            if current.is_symlink():
-                raise ValueError("target path traverses a symlink under storage root")
+            mode = os.lstat(current).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            # Not created yet; nothing below it exists either.
+            return
         except OSError as exc:
             # If the path is unreadable, treat it as unsafe.
             raise ValueError("target path validation failed (unreadable component)") from exc
+        if stat.S_ISLNK(mode):
+            raise ValueError("target path traverses a symlink under storage root")
+
+
+@lru_cache(maxsize=8)
+def _resolved_root(root: Path) -> Path:
+    # The storage root is static configuration; resolve it once instead of on every write.
+    return root.resolve(strict=False)
 
 
 def write_atomic_bytes(
     target_path: Path, data: bytes, *, storage_root: Path, fsync: bool = True
 ) -> None:
-    target = Path(target_path)
-    parent = target.parent
+    parent = _write_atomic_bytes(target_path, data, storage_root=storage_root, fsync=fsync)
+    if fsync:
+        _fsync_dir_best_effort(parent)
+
+
+def _write_atomic_bytes(target_path: Path, data: bytes, *, storage_root: Path, fsync: bool) -> Path:
+    parent = target_path.parent
     # Bug #13/#20: validate path and symlinks before any directory creation.
-    ensure_within_root(storage_root, target)
+    ensure_within_root(storage_root, target_path)
     _reject_symlinks_under_root(storage_root, parent)
     ensure_dir(parent)
 
     tmp_path: Path | None = None
-    fd: int | None = None
 
     try:
-        fd, tmp_name = tempfile.mkstemp(dir=str(parent), prefix=".tmp-")
-        tmp_path = Path(tmp_name)
-        _write_tmp_file(fd, data, fsync=fsync)
-        fd = None
-
-        _replace_tmp_with_target(tmp_path, target)
-
-        if fsync:
-            _fsync_dir_best_effort(parent)
+        tmp_path = _write_unnamed_tmp_file(parent, data, fsync=fsync)
+        if tmp_path is None:
+            # Expected on non-Linux and in sandboxes without /proc: when only the final link
+            # fails, the data was already written once and is written again here.
+            fd, tmp_name = tempfile.mkstemp(dir=str(parent), prefix=".tmp-")
+            tmp_path = Path(tmp_name)
+            _write_tmp_file(fd, data, fsync=fsync)
+
+        _replace_tmp_with_target(tmp_path, target_path)
     except Exception:
-        _safe_close(fd)
         _safe_unlink(tmp_path)
         raise
+    return parent
+
+
+def _write_unnamed_tmp_file(parent: Path, data: bytes, *, fsync: bool) -> Path | None:
+    """
+    Linux: write into an unnamed O_TMPFILE inode and link it in under a temp name only once
+    complete, so a crash mid-write leaves no stray file. Returns None where O_TMPFILE or
+    /proc linking is unavailable; the caller then uses mkstemp.
+    """
+    if not _O_TMPFILE:
+        return None
+    try:
+        fd = os.open(str(parent), _O_TMPFILE | os.O_WRONLY, 0o640)
+    except OSError:
+        return None  # kernel or filesystem without O_TMPFILE support
+    try:
+        _write_fd(fd, data, fsync=fsync)
+        name = f".tmp-{secrets.token_hex(8)}"
+        dir_fd = os.open(str(parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            # Passing dst_dir_fd makes os.link use linkat(AT_SYMLINK_FOLLOW), which is what
+            # materializes the /proc fd link; plain link() fails with EXDEV.
+            os.link(f"/proc/self/fd/{fd}", name, dst_dir_fd=dir_fd, follow_symlinks=True)
+        except OSError:
+            return None  # no /proc (or linkat restrictions)
+        finally:
+            os.close(dir_fd)
+        return parent / name
+    finally:
+        os.close(fd)
 
 
 def _write_tmp_file(fd: int, data: bytes, *, fsync: bool) -> None:
-    with os.fdopen(fd, "wb") as f:
-        f.write(data)
-        f.flush()
-        # Bug #21: set mode on fd before replace so target gets correct permissions.
-        os.fchmod(f.fileno(), 0o640)
-        if fsync:
-            os.fsync(f.fileno())
+    # Always closes fd.
+    try:
+        _write_fd(fd, data, fsync=fsync)
+    finally:
+        os.close(fd)
+
+
+def _write_fd(fd: int, data: bytes, *, fsync: bool) -> None:
+    # Unbuffered writes straight from the caller's buffer; no file object layer.
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+    # Bug #21: set mode on fd before replace so target gets correct permissions.
+    os.fchmod(fd, 0o640)
+    if fsync:
+        os.fsync(fd)
 
 
 def _replace_tmp_with_target(tmp_path: Path, target: Path) -> None:
@@ -127,15 +188,6 @@ def _replace_tmp_with_target(tmp_path: Path, target: Path) -> None:
         raise
 
 
-def _safe_close(fd: int | None) -> None:
-    if fd is None:
-        return
-    try:
-        os.close(fd)
-    except OSError:
-        pass
-
-
 def _safe_unlink(path: Path | None) -> None:
     if path is None:
         return
@@ -156,15 +208,117 @@ def move_file_within_root(
     Move a file from src to dst after validating both are within storage_root and dst
     doesn't traverse symlinks.
     """
-    src = Path(src)
-    dst = Path(dst)
+    dst_parent = _move_file_within_root(src, dst, storage_root=storage_root, fsync=fsync)
+    if fsync:
+        _fsync_dir_best_effort(dst_parent)
 
+
+def _move_file_within_root(src: Path, dst: Path, *, storage_root: Path, fsync: bool) -> Path:
+    dst_parent = dst.parent
     ensure_within_root(storage_root, src)
     ensure_within_root(storage_root, dst)
-    _reject_symlinks_under_root(storage_root, dst.parent)
+    _reject_symlinks_under_root(storage_root, dst_parent)
+
+    ensure_dir(dst_parent)
+    try:
+        os.replace(src, dst)
+    except OSError as exc:
+        # src and dst can sit on different mounts under the root (e.g. a bind-mounted dir).
+        if exc.errno != errno.EXDEV:
+            raise
+        _copy_across_devices(src, dst, fsync=fsync)
+        os.unlink(src)
+    return dst_parent
+
+
+def _copy_across_devices(src: Path, dst: Path, *, fsync: bool) -> None:
+    """Copy src to dst atomically (temp file + replace), in-kernel where possible."""
+    src_fd = os.open(str(src), os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    tmp_path: Path | None = None
+    try:
+        st = os.fstat(src_fd)
+        tmp_fd, tmp_name = tempfile.mkstemp(dir=str(dst.parent), prefix=".tmp-")
+        tmp_path = Path(tmp_name)
+        try:
+            _copy_fd_range(src_fd, tmp_fd, st.st_size)
+            os.fchmod(tmp_fd, stat.S_IMODE(st.st_mode))
+            if fsync:
+                os.fsync(tmp_fd)
+        finally:
+            os.close(tmp_fd)
+        os.replace(tmp_path, dst)
+        tmp_path = None
+        # The source is about to be unlinked; don't keep its pages cached.
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(src_fd)
+        _safe_unlink(tmp_path)
 
-    ensure_dir(dst.parent)
-    os.replace(src, dst)
 
-    if fsync:
-        _fsync_dir_best_effort(dst.parent)
+def _copy_fd_range(src_fd: int, dst_fd: int, size: int) -> None:
+    # copy_file_range lets the filesystem reflink or copy server-side; older kernels refuse
+    # cross-filesystem ranges (EXDEV), then sendfile still avoids user-space buffers.
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    break
+                copied += n
+        except OSError as exc:
+            if exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+    while copied < size:
+        n = os.sendfile(dst_fd, src_fd, copied, size - copied)
+        if n == 0:
+            break
+        copied += n
+
+
+class BatchedWriter:
+    """
+    Storage writes that share one directory fsync per parent directory.
+
+    File contents are still fsynced per write; only the directory-entry barriers are
+    deferred and issued once per distinct parent on flush() (or when the block exits
+    without error). Use it for a group of writes that only needs to be durable as a whole.
+    """
+
+    def __init__(self, *, storage_root: Path, fsync: bool = True) -> None:
+        self._storage_root = storage_root
+        self._fsync = fsync
+        self._dirs: dict[Path, None] = {}
+
+    def __enter__(self) -> BatchedWriter:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self._dirs.clear()
+
+    def flush(self) -> None:
+        """Fsync every parent directory written to since the last flush."""
+        dirs, self._dirs = self._dirs, {}
+        if self._fsync:
+            for dir_path in dirs:
+                _fsync_dir_best_effort(dir_path)
+
+    def write_bytes(self, target_path: Path, data: bytes) -> None:
+        parent = _write_bytes(target_path, data, storage_root=self._storage_root, fsync=self._fsync)
+        self._dirs[parent] = None
+
+    def write_atomic_bytes(self, target_path: Path, data: bytes) -> None:
+        parent = _write_atomic_bytes(
+            target_path, data, storage_root=self._storage_root, fsync=self._fsync
+        )
+        self._dirs[parent] = None
+
+    def move_file_within_root(self, src: Path, dst: Path) -> None:
+        parent = _move_file_within_root(
+            src, dst, storage_root=self._storage_root, fsync=self._fsync
+        )
+        self._dirs[parent] = None
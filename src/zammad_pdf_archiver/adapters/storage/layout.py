@@ -1,28 +1,50 @@
 from __future__ import annotations
 
 import re
+import string
+from functools import lru_cache
 from pathlib import Path
 
 from zammad_pdf_archiver.domain.path_policy import (
     ensure_within_root,
     sanitize_segment,
+    validate_and_sanitize_segment,
     validate_segments,
 )
 
+# Same default as validate_segments(max_depth=...).
+_MAX_SEGMENTS = 10
 _PREFIX_SPLIT_RE = re.compile(r"[>/]")
+_split_prefix = _PREFIX_SPLIT_RE.split
+# Path separators and NUL in a rendered filename; one scan instead of three `in` checks.
+_has_forbidden_filename_char = re.compile(r"[/\\\x00]").search
 
 
 def _parse_prefix_segments(prefix: str) -> list[str]:
     if not isinstance(prefix, str) or not prefix.strip():
         raise ValueError("allow_prefixes entries must be non-empty strings")
 
-    raw_parts = [p.strip() for p in _PREFIX_SPLIT_RE.split(prefix)]
+    raw_parts = [p.strip() for p in _split_prefix(prefix)]
     parts = [p for p in raw_parts if p]
     if not parts:
         raise ValueError("allow_prefixes entry produced no segments")
     return parts
 
 
+@lru_cache(maxsize=64)
+def _allowed_prefix_segments(prefixes: tuple[str, ...]) -> frozenset[tuple[str, ...]]:
+    # The allowlist comes from settings and is the same for every ticket; parse, validate and
+    # sanitize it once. Invalid entries raise and are not cached.
+    allowed: set[tuple[str, ...]] = set()
+    for prefix in prefixes:
+        prefix_parts = _parse_prefix_segments(prefix)
+        validate_segments(prefix_parts)
+        prefix_safe = [sanitize_segment(p) for p in prefix_parts]
+        validate_segments(prefix_safe)
+        allowed.add(tuple(prefix_safe))
+    return frozenset(allowed)
+
+
 def build_target_dir(
     root: Path,
     username: str,
@@ -41,39 +63,52 @@ def build_target_dir(
     if not isinstance(root, Path):
         root = Path(root)
 
-    validate_segments([username], max_depth=1)
-    validate_segments(list(segments))
-
-    user_safe = sanitize_segment(username)
-    segs_safe = [sanitize_segment(s) for s in segments]
-
-    validate_segments([user_safe], max_depth=1)
-    validate_segments(segs_safe)
+    if len(segments) > _MAX_SEGMENTS:
+        raise ValueError(f"too many path segments (max_depth={_MAX_SEGMENTS})")
+    user_safe = validate_and_sanitize_segment(username)
+    segs_safe = [validate_and_sanitize_segment(s) for s in segments]
 
     # Bug #30: empty list means no path allowed (allowlist is explicit).
     if allow_prefixes is not None and len(allow_prefixes) == 0:
         raise ValueError("allow_prefixes is empty; no archive path allowed")
 
     if allow_prefixes:
-        allowed: list[list[str]] = []
-        for prefix in allow_prefixes:
-            prefix_parts = _parse_prefix_segments(prefix)
-            validate_segments(prefix_parts)
-            prefix_safe = [sanitize_segment(p) for p in prefix_parts]
-            validate_segments(prefix_safe)
-            allowed.append(prefix_safe)
-
-        if not any(segs_safe[: len(prefix)] == prefix for prefix in allowed):
+        allowed = _allowed_prefix_segments(tuple(allow_prefixes))
+        segs_key = tuple(segs_safe)
+        # One set lookup per leading slice of the path (depth <= 10), whatever the allowlist
+        # size; prefixes always have at least one segment.
+        if not any(segs_key[:n] in allowed for n in range(1, len(segs_key) + 1)):
             raise ValueError("archive_path is not allowed by allow_prefixes policy")
 
-    target = root / user_safe
-    for seg in segs_safe:
-        target = target / seg
+    target = root.joinpath(user_safe, *segs_safe)
 
     ensure_within_root(root, target)
     return target
 
 
+_FILENAME_FIELDS = frozenset({"ticket_number", "timestamp_utc", "date_utc"})
+
+
+@lru_cache(maxsize=32)
+def _percent_template(pattern: str) -> str | None:
+    """
+    Translate a filename pattern that only uses plain known placeholders into a %-template.
+
+    The pattern is a static setting; parsing it once and rendering with % skips str.format's
+    per-call parse. Returns None for anything else (format specs, conversions, indexing,
+    unknown names), which then goes through str.format and its usual errors.
+    """
+    parts: list[str] = []
+    for literal, field, spec, conversion in string.Formatter().parse(pattern):
+        parts.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if field not in _FILENAME_FIELDS or spec or conversion:
+            return None
+        parts.append(f"%({field})s")
+    return "".join(parts)
+
+
 def build_filename_from_pattern(
     pattern: str,
     *,
@@ -97,11 +132,19 @@ def build_filename_from_pattern(
     ts_safe = sanitize_segment(timestamp_utc)
 
     try:
-        rendered = pattern.format(
-            ticket_number=ticket_safe,
-            timestamp_utc=ts_safe,
-            date_utc=ts_safe,
-        )
+        template = _percent_template(pattern)
+        if template is not None:
+            rendered = template % {
+                "ticket_number": ticket_safe,
+                "timestamp_utc": ts_safe,
+                "date_utc": ts_safe,
+            }
+        else:
+            rendered = pattern.format(
+                ticket_number=ticket_safe,
+                timestamp_utc=ts_safe,
+                date_utc=ts_safe,
+            )
     except KeyError as exc:
         raise ValueError(
             f"invalid filename_pattern format: unknown placeholder {exc.args[0]!r}"
@@ -121,7 +164,7 @@ def build_filename_from_pattern(
         raise ValueError("filename must not be '.' or '..'")
 
     # Disallow separators explicitly; patterns should not create directories.
-    if "/" in rendered or "\\" in rendered or "\x00" in rendered:
+    if _has_forbidden_filename_char(rendered):
         raise ValueError("filename_pattern must not include path separators or null bytes")
 
     validate_segments([rendered], max_depth=1, max_length=255)
@@ -0,0 +1,54 @@
+"""Optional persistent worker processes for PDF rendering and other CPU-bound jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _preload_weasyprint() -> None:
+    # Pay WeasyPrint's import cost (cairo/pango/fontconfig bindings) once per worker
+    # process instead of on the first render.
+    import weasyprint  # type: ignore[import-untyped]  # noqa: F401
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=False)
+            # Never fork: the parent runs an event loop, a Redis pool and other threads, and
+            # a forked child would inherit their locks in whatever state they were in.
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_preload_weasyprint,
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_worker_pool() -> None:
+    global _pool, _pool_workers
+    with _pool_lock:
+        pool, _pool, _pool_workers = _pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def run_in_worker_pool[T](worker_processes: int, job: Callable[[], T]) -> T:
+    """
+    Run a picklable job in the shared worker pool, or inline when worker_processes <= 0.
+    """
+    if worker_processes <= 0:
+        return job()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(worker_processes), job)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import random
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Literal, NoReturn, TypeVar
 
 import httpx
 from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
 
 from zammad_pdf_archiver.adapters.http_util import timeouts_for
 from zammad_pdf_archiver.adapters.zammad.errors import (
@@ -20,16 +24,37 @@ from zammad_pdf_archiver.adapters.zammad.models import Article, TagList, Ticket
 
 _T = TypeVar("_T")
 
+# Built once: a TypeAdapter compiles its validator on construction.
+_ARTICLE_LIST_ADAPTER = TypeAdapter(list[Article])
+_TAG_LIST_ADAPTER = TypeAdapter(list[str])
+
+# Per-request override for binary downloads; httpx copies it, so one shared dict is enough.
+_ATTACHMENT_HEADERS = {"Accept": "*/*"}
+
+
+def _attachment_path(ticket_id: int, article_id: int, attachment_id: int) -> str:
+    return f"api/v1/ticket_attachment/{ticket_id}/{article_id}/{attachment_id}"
+
+
+class _UnsuccessfulResponse(Exception):
+    """Internal: a non-2xx response, handed from _send to the retry loop."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        super().__init__(response.status_code)
+        self.response = response
+
 
 @dataclass(frozen=True, slots=True)
 class _RetryPolicy:
     # "retry up to 3 times" => 1 initial attempt + 3 retries = 4 total attempts.
     max_retries: int = 3
     backoff_base_seconds: float = 0.2
+    rng: Callable[[], float] = random.random
 
     def backoff_seconds(self, attempt: int) -> float:
         # attempt is 0-based for *retry count* (i.e., after the first failure).
-        return self.backoff_base_seconds * (2**attempt)
+        # Full jitter: workers hit by the same 429/5xx burst don't retry in lockstep.
+        return self.rng() * self.backoff_base_seconds * (2**attempt)
 
 
 class AsyncZammadClient:
@@ -41,6 +66,7 @@ class AsyncZammadClient:
         timeout_seconds: float = 10.0,
         verify_tls: bool = True,
         trust_env: bool = False,
+        http2: bool = False,
         retry_policy: _RetryPolicy | None = None,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
         http_client: httpx.AsyncClient | None = None,
@@ -71,6 +97,8 @@ class AsyncZammadClient:
             ),
             verify=verify_tls,
             trust_env=trust_env,
+            # One multiplexed connection carries concurrent attachment downloads.
+            http2=http2,
             follow_redirects=False,
         )
 
@@ -90,8 +118,8 @@ class AsyncZammadClient:
         await self.aclose()
 
     async def get_ticket(self, ticket_id: int) -> Ticket:
-        resp = await self._request_json("GET", f"api/v1/tickets/{ticket_id}")
-        return Ticket.model_validate(resp)
+        response = await self._request("GET", f"api/v1/tickets/{ticket_id}")
+        return _parse_json(response, Ticket.model_validate_json)
 
     async def list_tags(self, ticket_id: int) -> TagList:
         resp = await self._request_json(
@@ -107,7 +135,7 @@ class AsyncZammadClient:
             tags_value = resp
 
         try:
-            tags = TypeAdapter(list[str]).validate_python(tags_value)
+            tags = _TAG_LIST_ADAPTER.validate_python(tags_value)
         except ValidationError as exc:
             raise ClientError(
                 f"Zammad tags response format unexpected for ticket {ticket_id}: {exc!s}"
@@ -133,7 +161,7 @@ class AsyncZammadClient:
     async def create_internal_article(
         self, ticket_id: int, subject: str, body_html: str
     ) -> Article:
-        resp = await self._request_json(
+        response = await self._request(
             "POST",
             "api/v1/ticket_articles",
             json={
@@ -144,21 +172,68 @@ class AsyncZammadClient:
                 "internal": True,
             },
         )
-        return Article.model_validate(resp)
+        return _parse_json(response, Article.model_validate_json)
 
     async def list_articles(self, ticket_id: int) -> list[Article]:
-        resp = await self._request_json("GET", f"api/v1/ticket_articles/by_ticket/{ticket_id}")
-        items = TypeAdapter(list[dict[str, Any]]).validate_python(resp)
-        return [Article.model_validate(item) for item in items]
+        # Validated straight from the response bytes by pydantic-core, without building an
+        # intermediate list of dicts first. Validation is a small share of this call (JSON
+        # parsing dominates); from_json + model_construct measured ~2x slower and would
+        # leave created_at and attachments as raw str/dicts for the snapshot builder.
+        response = await self._request("GET", f"api/v1/ticket_articles/by_ticket/{ticket_id}")
+        return _parse_json(response, _ARTICLE_LIST_ADAPTER.validate_json)
 
     async def get_attachment_content(
-        self, ticket_id: int, article_id: int, attachment_id: int
-    ) -> bytes:
+        self,
+        ticket_id: int,
+        article_id: int,
+        attachment_id: int,
+        *,
+        max_bytes: int | None = None,
+    ) -> bytes | None:
         """Download attachment binary.
-        GET /api/v1/ticket_attachment/{ticket}/{article}/{attachment}."""
-        path = f"api/v1/ticket_attachment/{ticket_id}/{article_id}/{attachment_id}"
-        response = await self._request("GET", path, headers={"Accept": "*/*"})
-        return response.content
+        GET /api/v1/ticket_attachment/{ticket}/{article}/{attachment}.
+
+        The body is read through iter_attachment_content. With max_bytes, None is returned
+        as soon as it exceeds max_bytes, so an oversized attachment is never buffered whole.
+        A transfer that fails mid-body is retried from the start like any other request."""
+
+        async def collect() -> bytes | None:
+            buf = bytearray()
+            chunks = self.iter_attachment_content(ticket_id, article_id, attachment_id)
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    buf += chunk
+                    if max_bytes is not None and len(buf) > max_bytes:
+                        return None
+            return bytes(buf)
+
+        path = _attachment_path(ticket_id, article_id, attachment_id)
+        return await self._with_retries(path, collect)
+
+    async def iter_attachment_content(
+        self,
+        ticket_id: int,
+        article_id: int,
+        attachment_id: int,
+        *,
+        chunk_size: int = 65536,
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield attachment bytes as they arrive, for writing straight to a file.
+
+        The request is retried until the response headers arrive. Once bytes have been
+        yielded nothing is retried: a failure mid-body raises the httpx error to the caller.
+        The connection is released once the iterator is exhausted or closed (use
+        contextlib.aclosing when stopping early)."""
+        path = _attachment_path(ticket_id, article_id, attachment_id)
+        response = await self._with_retries(
+            path,
+            partial(self._send, "GET", path, headers=_ATTACHMENT_HEADERS, stream=True),
+        )
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await response.aclose()
 
     async def _request_json(
         self,
@@ -169,13 +244,7 @@ class AsyncZammadClient:
         json: Any | None = None,
     ) -> Any:
         response = await self._request(method, path, params=params, json=json)
-        try:
-            return response.json()
-        except ValueError as exc:  # pragma: no cover
-            raise ClientError(
-                "Invalid JSON from Zammad "
-                f"(status={response.status_code}) at {response.request.url!s}"
-            ) from exc
+        return _parse_json(response, from_json)
 
     async def _request(
         self,
@@ -184,17 +253,45 @@ class AsyncZammadClient:
         *,
         params: dict[str, str] | None = None,
         json: Any | None = None,
+    ) -> httpx.Response:
+        return await self._with_retries(
+            path, partial(self._send, method, path, params=params, json=json)
+        )
+
+    async def _send(
+        self,
+        method: Literal["GET", "POST"],
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+        json: Any | None = None,
         headers: dict[str, str] | None = None,
+        stream: bool = False,
     ) -> httpx.Response:
+        """
+        One attempt. stream=True returns a successful response with its body unread; the
+        caller must aclose() it. Non-2xx responses are closed and raised for _with_retries.
+        """
+        request = self._http.build_request(method, path, params=params, json=json, headers=headers)
+        response = await self._http.send(request, stream=stream)
+        if not 200 <= response.status_code < 300:
+            await response.aclose()
+            raise _UnsuccessfulResponse(response)
+        return response
+
+    async def _with_retries(self, path: str, attempt: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Run attempt() until it succeeds. Timeouts and transport errors raised anywhere in
+        it (including while reading a body) and retryable statuses are retried with backoff;
+        everything is mapped to the errors module once retries are exhausted.
+        """
         # Total attempts = 1 initial + max_retries
         max_attempts = self._retry.max_retries + 1
         retry_count = 0
 
         while True:
             try:
-                response = await self._http.request(
-                    method, path, params=params, json=json, headers=headers
-                )
+                return await attempt()
             except httpx.TimeoutException as exc:
                 retry_count = await self._retry_after_timeout_or_transport(
                     retry_count=retry_count,
@@ -210,6 +307,8 @@ class AsyncZammadClient:
                     exc=exc,
                 )
                 continue
+            except _UnsuccessfulResponse as exc:
+                response = exc.response
 
             retry_delay = self._retry_delay_for_response(
                 response,
@@ -221,9 +320,6 @@ class AsyncZammadClient:
                 retry_count += 1
                 continue
 
-            if 200 <= response.status_code < 300:
-                return response
-
             self._raise_for_status(response)
 
     async def _retry_after_timeout_or_transport(
@@ -285,6 +381,22 @@ class AsyncZammadClient:
         raise ClientError(f"Unexpected Zammad HTTP status={status} at {url}")
 
 
+def _parse_json[T](response: httpx.Response, parse: Callable[[bytes], T]) -> T:
+    """Parse/validate the raw body; malformed JSON becomes a ClientError."""
+    try:
+        return parse(response.content)
+    except ValueError as exc:
+        # ValidationError is a ValueError too; only JSON syntax errors are re-mapped.
+        if isinstance(exc, ValidationError) and all(
+            err["type"] != "json_invalid" for err in exc.errors()
+        ):
+            raise
+        raise ClientError(
+            "Invalid JSON from Zammad "
+            f"(status={response.status_code}) at {response.request.url!s}"
+        ) from exc
+
+
 def _parse_retry_after_seconds(value: str | None) -> float | None:
     if not value:
         return None
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import time
+from dataclasses import dataclass, field
 from typing import Any
 
 import structlog
@@ -11,6 +13,27 @@ from zammad_pdf_archiver.config.settings import Settings
 
 log = structlog.get_logger(__name__)
 
+# One pooled client per Redis URL for the process lifetime; history writes happen on every
+# ticket outcome, so connecting per event would dominate their cost.
+_REDIS_CLIENTS: dict[str, Any] = {}
+_REDIS_LOCK = asyncio.Lock()
+
+_HISTORY_BATCH_MAX = 32
+
+
+@dataclass
+class _HistoryBatch:
+    redis: Any
+    stream: str
+    maxlen: int
+    events: list[tuple[dict[str, str], asyncio.Future[bool]]] = field(default_factory=list)
+
+
+# Open batch per (client, stream, maxlen); events recorded in the same event-loop tick join
+# it and are sent as one pipeline by the flush task the first event scheduled.
+_PENDING_BATCHES: dict[tuple[int, str, int], _HistoryBatch] = {}
+_FLUSH_TASKS: set[asyncio.Task[None]] = set()
+
 
 def _import_redis() -> Any:
     try:
@@ -27,17 +50,39 @@ def _history_enabled(settings: Settings) -> bool:
 
 
 async def _redis_client(settings: Settings) -> Any | None:
-    if not _history_enabled(settings):
-        return None
-    Redis = _import_redis()
-    if Redis is None:
+    redis_url = settings.workflow.redis_url
+    if not redis_url or not _history_enabled(settings):
         return None
-    return Redis.from_url(
-        settings.workflow.redis_url,
-        decode_responses=True,
-        socket_timeout=5.0,
-        socket_connect_timeout=5.0,
-    )
+    async with _REDIS_LOCK:
+        cached = _REDIS_CLIENTS.get(redis_url)
+        if cached is not None:
+            return cached
+
+        Redis = _import_redis()
+        if Redis is None:
+            return None
+        client = Redis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_timeout=5.0,
+            socket_connect_timeout=5.0,
+            # Pooled connections can sit idle between tickets; PING before reusing a stale one.
+            health_check_interval=30,
+        )
+        _REDIS_CLIENTS[redis_url] = client
+        return client
+
+
+async def aclose_history_clients() -> None:
+    async with _REDIS_LOCK:
+        clients = list(_REDIS_CLIENTS.values())
+        _REDIS_CLIENTS.clear()
+
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            log.warning("history.redis_close_failed")
 
 
 def _bounded_message(message: str) -> str:
@@ -73,17 +118,56 @@ async def record_history_event(
 
     stream = settings.workflow.history_stream
     maxlen = int(settings.workflow.history_retention_maxlen)
+    ok = await _enqueue_history_event(redis, stream, maxlen, fields)
+    if not ok:
+        log.warning("history.record_failed", status=status, ticket_id=ticket_id)
+    return ok
+
+
+async def _enqueue_history_event(
+    redis: Any, stream: str, maxlen: int, fields: dict[str, str]
+) -> bool:
+    loop = asyncio.get_running_loop()
+    key = (id(redis), stream, maxlen)
+    batch = _PENDING_BATCHES.get(key)
+    if batch is None:
+        batch = _PENDING_BATCHES[key] = _HistoryBatch(redis, stream, maxlen)
+        task = loop.create_task(_flush_history_batch(key, batch))
+        _FLUSH_TASKS.add(task)
+        task.add_done_callback(_FLUSH_TASKS.discard)
+
+    future: asyncio.Future[bool] = loop.create_future()
+    batch.events.append((fields, future))
+    if len(batch.events) >= _HISTORY_BATCH_MAX and _PENDING_BATCHES.get(key) is batch:
+        del _PENDING_BATCHES[key]
+    return await future
+
+
+async def _flush_history_batch(key: tuple[int, str, int], batch: _HistoryBatch) -> None:
+    # Runs one loop iteration after the first event, so same-tick events are already queued.
+    if _PENDING_BATCHES.get(key) is batch:
+        del _PENDING_BATCHES[key]
+    events = batch.events
+    results: list[bool] = []
     try:
-        await redis.xadd(stream, fields, maxlen=maxlen, approximate=True)
-        return True
+        if len(events) == 1:
+            await batch.redis.xadd(
+                batch.stream, events[0][0], maxlen=batch.maxlen, approximate=True
+            )
+            results = [True]
+        else:
+            pipeline = batch.redis.pipeline(transaction=False)
+            for fields, _ in events:
+                pipeline.xadd(batch.stream, fields, maxlen=batch.maxlen, approximate=True)
+            replies = await pipeline.execute(raise_on_error=False)
+            results = [not isinstance(reply, Exception) for reply in replies]
     except Exception:
-        log.warning("history.record_failed", status=status, ticket_id=ticket_id)
-        return False
+        pass  # every event in the batch is reported as failed below
     finally:
-        try:
-            await redis.aclose()
-        except Exception:
-            pass
+        # Also on cancellation: no caller may be left waiting on its future.
+        for i, (_, future) in enumerate(events):
+            if not future.done():
+                future.set_result(i < len(results) and results[i])
 
 
 def _to_int(value: str | None, default: int | None = None) -> int | None:
@@ -149,11 +233,6 @@ async def read_history(
     except Exception:
         log.warning("history.read_failed")
         return []
-    finally:
-        try:
-            await redis.aclose()
-        except Exception:
-            pass
 
     out: list[dict[str, Any]] = []
     for message_id, raw_fields in entries:
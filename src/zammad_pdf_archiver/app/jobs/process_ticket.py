@@ -300,6 +300,7 @@ async def _process_ticket_with_client(
         timeout_seconds=settings.zammad.timeout_seconds,
         verify_tls=settings.zammad.verify_tls,
         trust_env=settings.hardening.transport.trust_env,
+        http2=settings.zammad.http2,
     ) as client:
         observe_total = True
         total_start = perf_counter()
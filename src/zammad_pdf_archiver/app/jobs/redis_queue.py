@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from typing import Any
 
 import structlog
+from pydantic_core import from_json
 
 from zammad_pdf_archiver.app.jobs.history import record_history_event
 from zammad_pdf_archiver.app.jobs.process_ticket import process_ticket
@@ -118,7 +119,7 @@ class _QueueEnvelope:
 def _decode_envelope(message_id: Any, raw_fields: dict[Any, Any]) -> _QueueEnvelope:
     fields = {_as_str(key): value for key, value in raw_fields.items()}
     payload_raw = _as_str(fields.get("payload_json", "{}"))
-    payload = json.loads(payload_raw)
+    payload = from_json(payload_raw)
     if not isinstance(payload, dict):
         raise ValueError("payload_json is not an object")
 
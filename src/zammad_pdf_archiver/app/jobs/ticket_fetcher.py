@@ -5,6 +5,7 @@ from Zammad, abstracting away the client details.
 """
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -35,8 +36,8 @@ async def fetch_ticket_data(
     Returns:
         TicketData containing ticket, tags, and ID
     """
-    ticket = await client.get_ticket(ticket_id)
-    tags = await client.list_tags(ticket_id)
+    # Independent requests; issue both at once instead of paying two round trips.
+    ticket, tags = await asyncio.gather(client.get_ticket(ticket_id), client.list_tags(ticket_id))
     
     return TicketData(
         ticket=ticket,
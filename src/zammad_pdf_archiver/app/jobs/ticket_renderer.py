@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from zammad_pdf_archiver.adapters.pdf.render_pdf import render_pdf
+from zammad_pdf_archiver.adapters.pdf.render_pool import render_pdf_async
 from zammad_pdf_archiver.adapters.signing.sign_pdf import sign_pdf
 from zammad_pdf_archiver.adapters.snapshot.build_snapshot import (
     build_snapshot,
@@ -67,6 +67,7 @@ async def build_and_render_pdf(
         ticket_id,
         ticket=ticket,
         tags=tags,
+        worker_processes=settings.pdf.render_worker_processes,
     )
     
     # Handle article limit capping
@@ -98,13 +99,18 @@ async def build_and_render_pdf(
     
     # Render PDF
     render_start = perf_counter()
-    pdf_bytes = render_pdf(
+    pdf_bytes = await render_pdf_async(
         snapshot,
         settings.pdf.template,
+        worker_processes=settings.pdf.render_worker_processes,
         max_articles=settings.pdf.max_articles,
         locale=settings.pdf.locale,
         timezone=settings.pdf.timezone,
         templates_root=settings.pdf.templates_root,
+        cache_dir=settings.pdf.render_cache_dir,
+        cache_max_bytes=settings.pdf.render_cache_max_bytes,
+        bytecode_cache_dir=settings.pdf.template_bytecode_cache_dir,
+        templates_auto_reload=settings.pdf.templates_auto_reload,
     )
     render_seconds.observe(perf_counter() - render_start)
     
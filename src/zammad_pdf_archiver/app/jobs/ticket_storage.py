@@ -13,9 +13,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from zammad_pdf_archiver.adapters.storage.fs_storage import (
+    BatchedWriter,
     ensure_dir,
     move_file_within_root,
-    write_bytes,
 )
 from zammad_pdf_archiver.domain.audit import build_audit_record, compute_sha256
 from zammad_pdf_archiver.domain.path_policy import sanitize_segment
@@ -124,6 +124,9 @@ def store_ticket_files(
         paths.target_path.parent / f".tmp-archiving-{ticket_id}-{uuid.uuid4().hex[:8]}"
     )
     attachment_entries: list[dict[str, Any]] = []
+    # Staged files only need to be durable together before the moves below, so each temp
+    # directory is fsynced once instead of after every write.
+    staging = BatchedWriter(storage_root=settings.storage.root, fsync=settings.storage.fsync)
     
     try:
         ensure_dir(temp_archive_root)
@@ -151,12 +154,7 @@ def store_ticket_files(
                             f"{article.id}_{att.attachment_id or 0}_{att.filename or 'bin'}"
                         ) or f"article_{article.id}_{att.attachment_id or 0}"
                         attach_temp_path = temp_attachments_dir / safe_name
-                        write_bytes(
-                            attach_temp_path,
-                            att.content,
-                            fsync=settings.storage.fsync,
-                            storage_root=settings.storage.root,
-                        )
+                        staging.write_bytes(attach_temp_path, att.content)
                         attachment_entries.append(
                             {
                                 "storage_path": str(attachments_dir / safe_name),
@@ -184,18 +182,9 @@ def store_ticket_files(
         ).encode("utf-8")
         
         # Write PDF and sidecar into temp dir
-        write_bytes(
-            temp_pdf_path,
-            pdf_bytes,
-            fsync=settings.storage.fsync,
-            storage_root=settings.storage.root,
-        )
-        write_bytes(
-            temp_sidecar_path,
-            audit_bytes,
-            fsync=settings.storage.fsync,
-            storage_root=settings.storage.root,
-        )
+        staging.write_bytes(temp_pdf_path, pdf_bytes)
+        staging.write_bytes(temp_sidecar_path, audit_bytes)
+        staging.flush()
         
         # ATOMIC "COMMIT" (Moves)
         # We use move_file_within_root which performs rename (atomic on same FS).
@@ -203,12 +192,11 @@ def store_ticket_files(
             ensure_dir(attachments_dir)
             for entry in attachment_entries:
                 fname = Path(entry["storage_path"]).name
-                move_file_within_root(
-                    temp_attachments_dir / fname,
-                    attachments_dir / fname,
-                    storage_root=settings.storage.root,
-                    fsync=settings.storage.fsync,
+                staging.move_file_within_root(
+                    temp_attachments_dir / fname, attachments_dir / fname
                 )
+            # One attachments-dir fsync, still before the PDF and sidecar moves.
+            staging.flush()
         
         # Move PDF
         move_file_within_root(
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from zammad_pdf_archiver._version import __version__
+from zammad_pdf_archiver.adapters.worker_pool import shutdown_worker_pool
+from zammad_pdf_archiver.app.jobs.history import aclose_history_clients
 from zammad_pdf_archiver.app.jobs.redis_queue import (
     aclose_queue_clients,
     start_queue_worker,
@@ -41,8 +44,15 @@ async def lifespan(app: FastAPI):
     if settings is not None:
         await stop_queue_worker(settings)
     await wait_for_tasks()
+    shutdown_worker_pool()
+    # Only close TSA clients if signing loaded the module; importing it here would pull in
+    # pyHanko just to shut down.
+    tsa = sys.modules.get("zammad_pdf_archiver.adapters.signing.tsa_rfc3161")
+    if tsa is not None:
+        tsa.close_tsa_clients()
     await aclose_stores()
     await aclose_queue_clients()
+    await aclose_history_clients()
 
 
 async def _global_exception_handler(request, exc):
@@ -77,6 +77,7 @@ _CANONICAL_MAPPINGS: tuple[tuple[str, tuple[str, ...]], ...] = (
     ("WEBHOOK_HMAC_SECRET", ("zammad", "webhook_hmac_secret")),
     ("ZAMMAD_TIMEOUT_SECONDS", ("zammad", "timeout_seconds")),
     ("ZAMMAD_VERIFY_TLS", ("zammad", "verify_tls")),
+    ("ZAMMAD_HTTP2", ("zammad", "http2")),
     # Workflow
     ("WORKFLOW_TRIGGER_TAG", ("workflow", "trigger_tag")),
     ("WORKFLOW_REQUIRE_TAG", ("workflow", "require_tag")),
@@ -112,6 +113,11 @@ _CANONICAL_MAPPINGS: tuple[tuple[str, tuple[str, ...]], ...] = (
     ("PDF_INCLUDE_ATTACHMENT_BINARY", ("pdf", "include_attachment_binary")),
     ("PDF_MAX_ATTACHMENT_BYTES_PER_FILE", ("pdf", "max_attachment_bytes_per_file")),
     ("PDF_MAX_TOTAL_ATTACHMENT_BYTES", ("pdf", "max_total_attachment_bytes")),
+    ("PDF_RENDER_WORKER_PROCESSES", ("pdf", "render_worker_processes")),
+    ("PDF_RENDER_CACHE_DIR", ("pdf", "render_cache_dir")),
+    ("PDF_RENDER_CACHE_MAX_BYTES", ("pdf", "render_cache_max_bytes")),
+    ("PDF_TEMPLATE_BYTECODE_CACHE_DIR", ("pdf", "template_bytecode_cache_dir")),
+    ("PDF_TEMPLATES_AUTO_RELOAD", ("pdf", "templates_auto_reload")),
     # Signing
     ("SIGNING_ENABLED", ("signing", "enabled")),
     ("SIGNING_PFX_PATH", ("signing", "pfx_path")),
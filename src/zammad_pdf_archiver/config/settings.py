@@ -27,6 +27,7 @@ class ZammadSettings(_BaseSection):
     webhook_hmac_secret: SecretStr | None = None
     timeout_seconds: float = Field(default=10.0, gt=0)
     verify_tls: bool = True
+    http2: bool = False
 
 
 class WorkflowSettings(_BaseSection):
@@ -115,6 +116,15 @@ class PdfSettings(_BaseSection):
     include_attachment_binary: bool = False
     max_attachment_bytes_per_file: int = Field(default=10 * 1024 * 1024, ge=0)  # 10 MiB
     max_total_attachment_bytes: int = Field(default=50 * 1024 * 1024, ge=0)  # 50 MiB
+    # 0 = render inline in the service process; > 0 = persistent render worker processes.
+    render_worker_processes: int = Field(default=0, ge=0)
+    # Content-addressed cache of rendered PDFs (unset = disabled); 0 bytes = no size cap.
+    render_cache_dir: Path | None = None
+    render_cache_max_bytes: int = Field(default=256 * 1024 * 1024, ge=0)  # 256 MiB
+    # Jinja compiled-template cache shared across workers/restarts (unset = disabled).
+    template_bytecode_cache_dir: Path | None = None
+    # Re-check templates_root files for edits on each render (packaged templates never reload).
+    templates_auto_reload: bool = True
 
     @property
     def template(self) -> str:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import ipaddress
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -134,6 +135,17 @@ def _validate_primary_transport(
             )
         )
 
+    if settings.zammad.http2 and importlib.util.find_spec("h2") is None:
+        issues.append(
+            ConfigValidationIssue(
+                path="zammad.http2",
+                message=(
+                    "HTTP/2 requires the h2 package. "
+                    "Install zammad-pdf-archiver[http2] or set zammad.http2=false."
+                ),
+            )
+        )
+
     _validate_upstream_host(
         url=str(settings.zammad.base_url),
         path="zammad.base_url",
@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import sys
 from datetime import datetime
+from functools import lru_cache
 from importlib import metadata
 from pathlib import Path
 from typing import Any
@@ -28,12 +29,11 @@ def _safe_get_service_version(dist_name: str) -> str | None:
 def _extract_cert_fingerprint(settings: Any) -> str | None:
     """
     Best-effort extraction of a signing certificate fingerprint (SHA-256 hex).
+
+    Parsed fingerprints are cached per (path, mtime, size), so an audit record per archived
+    PDF does not re-parse the PKCS#12 bundle; replacing the file invalidates the entry.
     """
     try:
-        from cryptography import x509
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives.serialization import pkcs12
-
         pfx_path = getattr(settings, "pfx_path", None)
         if pfx_path is not None:
             password_secret = getattr(settings, "pfx_password", None)
@@ -47,26 +47,58 @@ def _extract_cert_fingerprint(settings: Any) -> str | None:
                 password_str = str(password_secret)
             password = password_str.encode("utf-8") if password_str else None
 
-            pfx_bytes = Path(pfx_path).read_bytes()
-            _key, cert, _extra = pkcs12.load_key_and_certificates(pfx_bytes, password)
-            if cert is None:
-                return None
-            return cert.fingerprint(hashes.SHA256()).hex()
+            st = Path(pfx_path).stat()
+            return _pfx_fingerprint(str(pfx_path), st.st_mtime_ns, st.st_size, password)
 
         pades = getattr(settings, "pades", None)
         cert_path = getattr(pades, "cert_path", None) if pades is not None else None
         if cert_path is not None:
-            raw = Path(cert_path).read_bytes()
-            if raw.lstrip().startswith(b"-----BEGIN"):
-                cert = x509.load_pem_x509_certificate(raw)
-            else:
-                cert = x509.load_der_x509_certificate(raw)
-            return cert.fingerprint(hashes.SHA256()).hex()
+            st = Path(cert_path).stat()
+            return _cert_file_fingerprint(str(cert_path), st.st_mtime_ns, st.st_size)
     except Exception:
         return None
     return None
 
 
+# Parsed PFX fingerprints keyed by (path, mtime_ns, size, password digest), like sign_pdf's
+# signer cache, so the PKCS#12 password itself is never retained as a cache key.
+_PFX_FINGERPRINTS: dict[tuple[str, int, int, bytes], str | None] = {}
+_PFX_FINGERPRINTS_MAX = 8
+
+
+def _pfx_fingerprint(path: str, mtime_ns: int, size: int, password: bytes | None) -> str | None:
+    key = (path, mtime_ns, size, hashlib.sha256(password or b"").digest())
+    if key in _PFX_FINGERPRINTS:
+        return _PFX_FINGERPRINTS[key]
+
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.serialization import pkcs12
+
+    _key, cert, _extra = pkcs12.load_key_and_certificates(Path(path).read_bytes(), password)
+    fingerprint = cert.fingerprint(hashes.SHA256()).hex() if cert is not None else None
+    if len(_PFX_FINGERPRINTS) >= _PFX_FINGERPRINTS_MAX:
+        _PFX_FINGERPRINTS.clear()
+    _PFX_FINGERPRINTS[key] = fingerprint
+    return fingerprint
+
+
+@lru_cache(maxsize=8)
+def _cert_file_fingerprint(
+    path: str,
+    mtime_ns: int,  # noqa: ARG001 - cache key only
+    size: int,  # noqa: ARG001 - cache key only
+) -> str:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes
+
+    raw = Path(path).read_bytes()
+    if raw.lstrip().startswith(b"-----BEGIN"):
+        cert = x509.load_pem_x509_certificate(raw)
+    else:
+        cert = x509.load_der_x509_certificate(raw)
+    return cert.fingerprint(hashes.SHA256()).hex()
+
+
 def _get_fingerprint(signing_settings: Any) -> str | None:
     if not signing_settings or not getattr(signing_settings, "enabled", False):
         return None
@@ -91,9 +123,7 @@ def build_audit_record(
     )
     timestamp = getattr(signing_settings, "timestamp", None) if signing_settings else None
     tsa_used = bool(getattr(timestamp, "enabled", False)) if timestamp is not None else False
-    cert_fingerprint = (
-        _get_fingerprint(signing_settings) if signing_settings else None
-    )
+    cert_fingerprint = _get_fingerprint(signing_settings) if signing_settings else None
 
     signing: dict[str, Any] = {"enabled": signing_enabled, "tsa_used": tsa_used}
     if cert_fingerprint:
@@ -69,6 +69,10 @@ _ALLOWED_ATTRS: Final[dict[str, frozenset[str]]] = {
 
 _ALLOWED_HREF_SCHEMES: Final[frozenset[str]] = frozenset({"", "http", "https", "mailto"})
 
+# Emitted tags that start / end a line in the plain-text rendering of the sanitized HTML.
+_TEXT_BREAK_BEFORE: Final[frozenset[str]] = frozenset({"p", "div", "br", "li", "tr"})
+_TEXT_BREAK_AFTER: Final[frozenset[str]] = frozenset({"p", "div", "li", "tr"})
+
 
 def _sanitize_href(raw: str) -> str | None:
     href = raw.strip()
@@ -97,6 +101,8 @@ class _AllowlistHTMLSanitizer(HTMLParser):
     def __init__(self) -> None:
         super().__init__(convert_charrefs=True)
         self._out: list[str] = []
+        # Plain text of exactly what lands in _out, so callers need no second parse.
+        self._text: list[str] = []
         self._open: list[_OpenTag] = []
         self._skip_depth = 0
 
@@ -112,6 +118,8 @@ class _AllowlistHTMLSanitizer(HTMLParser):
 
         cleaned = self._clean_attrs(tag, attrs)
         attr_text = "".join(f' {k}="{escape(v, quote=True)}"' for k, v in cleaned)
+        if tag in _TEXT_BREAK_BEFORE:
+            self._text.append("\n")
         if tag in _VOID_TAGS:
             self._out.append(f"<{tag}{attr_text} />")
             return
@@ -178,24 +186,40 @@ class _AllowlistHTMLSanitizer(HTMLParser):
         if self._open[-1].name != tag:
             return
         self._open.pop()
+        self._emit_endtag(tag)
+
+    def _emit_endtag(self, tag: str) -> None:
         self._out.append(f"</{tag}>")
+        if tag in _TEXT_BREAK_AFTER:
+            self._text.append("\n")
 
     def handle_data(self, data: str) -> None:
         if self._skip_depth:
             return
         if data:
             self._out.append(escape(data))
+            self._text.append(data)
 
     def close(self) -> None:
         super().close()
         # Close any still-open tags to keep output well-formed.
         while self._open:
-            tag = self._open.pop().name
-            self._out.append(f"</{tag}>")
+            self._emit_endtag(self._open.pop().name)
 
     def sanitized_html(self) -> str:
         return "".join(self._out).strip()
 
+    def plain_text(self) -> str:
+        return normalize_text("".join(self._text))
+
+
+def normalize_text(text: str) -> str:
+    """Strip every line, drop empty ones, and trim the result."""
+    # Normalize whitespace without being too opinionated about newlines. One splitlines pass:
+    # stripped lines contain no line boundaries, and joining non-empty stripped lines leaves
+    # nothing to trim at either end.
+    return "\n".join(stripped for line in text.splitlines() if (stripped := line.strip()))
+
 
 def sanitize_html_fragment(html: str) -> str:
     """
@@ -220,3 +244,24 @@ def sanitize_html_fragment(html: str) -> str:
     except Exception:
         # Fail closed: return empty so callers can fall back to rendering body_text.
         return ""
+
+
+def sanitize_html_fragment_with_text(html: str) -> tuple[str, str]:
+    """
+    Sanitize like sanitize_html_fragment and also return the sanitized HTML's plain text.
+
+    Both come from one parse. The text matches what stripping the sanitized HTML to text
+    would give: line breaks around p/div/br/li/tr, whitespace normalized. Returns ("", "")
+    when sanitization fails or yields nothing.
+    """
+    if not isinstance(html, str) or not html:
+        return "", ""
+
+    try:
+        parser = _AllowlistHTMLSanitizer()
+        parser.feed(html)
+        parser.close()
+        sanitized = parser.sanitized_html()
+        return (sanitized, parser.plain_text()) if sanitized else ("", "")
+    except Exception:
+        return "", ""
@@ -71,6 +71,17 @@ def validate_segments(
     return [_validate_segment(seg, max_length=max_length) for seg in segments]
 
 
+def validate_and_sanitize_segment(seg: str, *, max_length: int = 64) -> str:
+    """
+    Validate a raw segment, sanitize it, and validate the sanitized result.
+
+    Same checks as validate_segments() before and after sanitize_segment(), for one segment.
+    """
+    return _validate_segment(
+        sanitize_segment(_validate_segment(seg, max_length=max_length)), max_length=max_length
+    )
+
+
 def _validate_segment(seg: str, *, max_length: int) -> str:
     if not isinstance(seg, str):
         raise TypeError("segments must be strings")
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import errno
 from pathlib import Path
 
 import pytest
 
-from zammad_pdf_archiver.adapters.storage import write_atomic_bytes
+from zammad_pdf_archiver.adapters.storage import fs_storage, write_atomic_bytes
 from zammad_pdf_archiver.adapters.storage.fs_storage import write_bytes
 
 
@@ -46,6 +47,20 @@ def test_write_atomic_bytes_overwrites_existing_file(tmp_path: Path) -> None:
     assert _tmp_files(tmp_path) == []
 
 
+def test_write_atomic_bytes_falls_back_to_mkstemp_without_o_tmpfile(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(fs_storage, "_O_TMPFILE", 0)
+    target = tmp_path / "payload.bin"
+    target.write_bytes(b"old")
+
+    write_atomic_bytes(target, b"new-data", storage_root=tmp_path, fsync=False)
+
+    assert target.read_bytes() == b"new-data"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert _tmp_files(tmp_path) == []
+
+
 def test_write_atomic_bytes_cleans_up_temp_on_exception(tmp_path: Path) -> None:
     target_dir = tmp_path / "target-dir"
     target_dir.mkdir()
@@ -84,3 +99,45 @@ def test_storage_writes_reject_symlink_traversal_under_root(tmp_path: Path) -> N
     target = link / "payload.bin"
     with pytest.raises(ValueError, match="symlink|escapes root"):
         write_atomic_bytes(target, b"x", storage_root=root)
+
+
+def test_move_file_within_root_copies_across_devices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "scratch" / "payload.bin"
+    src.parent.mkdir()
+    src.write_bytes(b"x" * 100_000)
+    src.chmod(0o640)
+    dst = tmp_path / "archive" / "payload.bin"
+    real_replace = fs_storage.os.replace
+
+    def _replace(a, b):
+        if Path(a) == src:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return real_replace(a, b)
+
+    monkeypatch.setattr(fs_storage.os, "replace", _replace)
+
+    fs_storage.move_file_within_root(src, dst, storage_root=tmp_path, fsync=False)
+
+    assert not src.exists()
+    assert dst.read_bytes() == b"x" * 100_000
+    assert dst.stat().st_mode & 0o777 == 0o640
+    assert _tmp_files(dst.parent) == []
+
+
+def test_batched_writer_fsyncs_each_parent_dir_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    synced: list[Path] = []
+    monkeypatch.setattr(fs_storage, "_fsync_dir_best_effort", synced.append)
+
+    with fs_storage.BatchedWriter(storage_root=tmp_path) as batch:
+        for i in range(3):
+            batch.write_bytes(tmp_path / "a" / f"{i}.bin", b"x")
+            batch.write_atomic_bytes(tmp_path / "b" / f"{i}.bin", b"y")
+        batch.move_file_within_root(tmp_path / "a" / "0.bin", tmp_path / "c" / "0.bin")
+        assert synced == []
+
+    assert synced == [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+    assert (tmp_path / "c" / "0.bin").read_bytes() == b"x"
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 from pydantic import SecretStr
 
+from zammad_pdf_archiver.domain import audit as audit_module
 from zammad_pdf_archiver.domain.audit import build_audit_record, compute_sha256
 
 
@@ -109,6 +110,19 @@ def test_build_audit_record_extracts_cert_fingerprint_from_pfx(tmp_path: Path) -
     assert audit["signing"]["cert_fingerprint"] == expected
 
 
+def test_pfx_fingerprint_cache_is_keyed_on_password_digest(tmp_path: Path) -> None:
+    pfx_path = tmp_path / "test.pfx"
+    _write_test_pfx(pfx_path, password="secret")
+    st = pfx_path.stat()
+
+    fingerprint = audit_module._pfx_fingerprint(
+        str(pfx_path), st.st_mtime_ns, st.st_size, b"secret"
+    )
+
+    assert fingerprint == _cert_fingerprint_from_pfx(pfx_path, password="secret")
+    assert all(b"secret" not in key for key in audit_module._PFX_FINGERPRINTS)
+
+
 def test_build_audit_record_includes_attachments_when_provided() -> None:
     """Optional attachment list is added to audit record (PRD §8.2)."""
     audit = build_audit_record(
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
+from zammad_pdf_archiver.config import validate as validate_module
 from zammad_pdf_archiver.config.load import load_settings
 from zammad_pdf_archiver.config.settings import Settings
 from zammad_pdf_archiver.config.validate import ConfigValidationError, validate_settings
@@ -345,6 +346,31 @@ def test_validate_settings_rejects_insecure_tls_by_default() -> None:
     assert "zammad.verify_tls" in str(exc.value)
 
 
+def test_validate_settings_requires_h2_for_http2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(validate_module.importlib.util, "find_spec", lambda name: None)
+    settings = Settings.from_mapping(
+        {
+            "zammad": {
+                "base_url": "https://zammad.example.local",
+                "api_token": "test-token",
+                "http2": True,
+            },
+            "storage": {"root": "/mnt/archive"},
+            "hardening": {
+                "webhook": {
+                    "allow_unsigned": True,
+                    "allow_unsigned_when_no_secret": True,
+                }
+            },
+        }
+    )
+
+    with pytest.raises(ConfigValidationError) as exc:
+        validate_settings(settings)
+
+    assert "zammad.http2" in str(exc.value)
+
+
 def test_validate_settings_rejects_loopback_upstream_by_default() -> None:
     settings = Settings.from_mapping(
         {
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
+from types import ModuleType
+
+import httpx
+import pytest
+
+from zammad_pdf_archiver.adapters.zammad.client import AsyncZammadClient
 
 
 def _run_script(script: Path, *args: str) -> subprocess.CompletedProcess[str]:
@@ -14,6 +22,15 @@ def _run_script(script: Path, *args: str) -> subprocess.CompletedProcess[str]:
     )
 
 
+def _load_script_module(script: Path, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(script.stem, script)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
 def test_seed_demo_data_supports_dry_run() -> None:
     repo_root = Path(__file__).resolve().parents[2]
     script = repo_root / "scripts" / "demo" / "seed_demo_data.py"
@@ -33,5 +50,48 @@ def test_capture_screenshots_supports_dry_run() -> None:
     assert proc.returncode == 0, proc.stderr
     assert "01-admin-token-screen.png" in proc.stdout
     assert "09-api-503-backend-unavailable.png" in proc.stdout
-    assert "docker compose -f docker-compose.demo.yml stop redis-demo" in proc.stdout
+    assert "docker stop redis-demo" in proc.stdout
+
+
+def test_mock_zammad_api_inprocess_client_serves_zammad_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    mock = _load_script_module(repo_root / "scripts" / "demo" / "mock_zammad_api.py", monkeypatch)
+    dataset = repo_root / "examples" / "demo" / "mock_university_dataset.json"
+
+    async def run() -> None:
+        http = mock.create_inprocess_client(dataset_path=dataset, api_token="demo-token")
+        async with http, AsyncZammadClient(
+            base_url="http://zammad-mock", api_token="unused", http_client=http
+        ) as client:
+            ticket = await client.get_ticket(1101)
+            tags = await client.list_tags(1101)
+            articles = await client.list_articles(1101)
+
+        assert ticket.id == 1101
+        assert "pdf:sign" in tags.root
+        assert articles
+
+    asyncio.run(run())
+
+
+def test_seed_demo_data_wait_for_ready_fails_fast_when_refused(monkeypatch) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    seed = _load_script_module(repo_root / "scripts" / "demo" / "seed_demo_data.py", monkeypatch)
+    monkeypatch.setattr(seed, "_POLL_INITIAL_DELAY_S", 0.001)
+    monkeypatch.setattr(seed, "_CONNECT_FAILURE_GRACE_S", 0.0)
+    attempts = 0
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(refuse)) as client:
+            with pytest.raises(RuntimeError, match="unreachable"):
+                await seed._wait_for_ready(client, "archiver", "http://archiver/healthz")
 
+    asyncio.run(run())
+    assert attempts == seed._CONNECT_FAILURE_THRESHOLD
@@ -116,3 +116,94 @@ def test_record_history_event_redacts_sensitive_message(monkeypatch, tmp_path) -
     assert len(fake.xadd_calls) == 1
     _, fields, _, _ = fake.xadd_calls[0]
     assert fields["message"] == "Authorization: Bearer [redacted] token=[redacted]"
+
+
+def test_redis_client_is_reused_until_closed(monkeypatch, tmp_path) -> None:
+    settings = make_settings(
+        str(tmp_path),
+        overrides={"workflow": {"redis_url": "redis://localhost/0"}},
+    )
+    created: list[_FakeRedis] = []
+    closed: list[_FakeRedis] = []
+
+    class _FakeRedisFactory:
+        @staticmethod
+        def from_url(_url: str, **_kwargs) -> _FakeRedis:
+            client = _FakeRedis()
+            created.append(client)
+
+            async def _aclose() -> None:
+                closed.append(client)
+
+            client.aclose = _aclose  # type: ignore[method-assign]
+            return client
+
+    monkeypatch.setattr(history, "_import_redis", lambda: _FakeRedisFactory)
+    monkeypatch.setattr(history, "_REDIS_CLIENTS", {})
+
+    async def run() -> None:
+        for ticket_id in (1, 2, 3):
+            assert await history.record_history_event(
+                settings, status="processed", ticket_id=ticket_id
+            )
+        assert await history.read_history(settings, limit=5) == []
+        await history.aclose_history_clients()
+
+    asyncio.run(run())
+
+    assert len(created) == 1
+    assert len(created[0].xadd_calls) == 3
+    assert closed == created
+
+
+class _FakePipeline:
+    def __init__(self, redis: _PipelinedFakeRedis) -> None:
+        self._redis = redis
+        self._queued: list[dict[str, str]] = []
+
+    def xadd(self, stream: str, fields: dict[str, str], maxlen=None, approximate=True):
+        self._queued.append(fields)
+        return self
+
+    async def execute(self, raise_on_error: bool = True):
+        self._redis.batches.append(self._queued)
+        return [RuntimeError("OOM") if f["ticket_id"] == "3" else "1-0" for f in self._queued]
+
+
+class _PipelinedFakeRedis(_FakeRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[dict[str, str]]] = []
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        assert transaction is False
+        return _FakePipeline(self)
+
+
+def test_concurrent_history_events_share_one_pipeline(monkeypatch, tmp_path) -> None:
+    settings = make_settings(
+        str(tmp_path),
+        overrides={"workflow": {"redis_url": "redis://localhost/0"}},
+    )
+    fake = _PipelinedFakeRedis()
+
+    async def _stub_client(_settings):
+        return fake
+
+    monkeypatch.setattr(history, "_redis_client", _stub_client)
+
+    async def run() -> list[bool]:
+        return await asyncio.gather(
+            *(
+                history.record_history_event(settings, status="processed", ticket_id=i)
+                for i in range(1, 6)
+            )
+        )
+
+    results = asyncio.run(run())
+
+    assert results == [True, True, False, True, True]
+    assert fake.xadd_calls == []
+    assert [[f["ticket_id"] for f in batch] for batch in fake.batches] == [
+        ["1", "2", "3", "4", "5"]
+    ]
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from zammad_pdf_archiver.domain.html_sanitize import sanitize_html_fragment
+from zammad_pdf_archiver.domain.html_sanitize import (
+    sanitize_html_fragment,
+    sanitize_html_fragment_with_text,
+)
 
 
 def test_sanitize_html_fragment_drops_scripts_and_event_handlers() -> None:
@@ -35,3 +38,20 @@ def test_sanitize_html_fragment_rejects_scheme_relative_urls() -> None:
     out = sanitize_html_fragment(raw)
     assert "href=" not in out
 
+
+
+def test_sanitize_html_fragment_with_text_returns_html_and_its_text() -> None:
+    raw = (
+        "<div>Hi &amp; bye<script>x()</script></div><p>one<br/>two</span>"
+        "<ul><li>a</li><li>b &lt;c&gt;</ul><font>tail</font>"
+    )
+
+    html, text = sanitize_html_fragment_with_text(raw)
+
+    assert html == sanitize_html_fragment(raw)
+    assert text == "Hi & bye\none\ntwo\na\nb <c>tail"
+
+
+def test_sanitize_html_fragment_with_text_is_empty_when_nothing_survives() -> None:
+    assert sanitize_html_fragment_with_text("<script>x()</script>") == ("", "")
+    assert sanitize_html_fragment_with_text("") == ("", "")
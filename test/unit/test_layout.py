@@ -4,7 +4,11 @@ from pathlib import Path
 
 import pytest
 
-from zammad_pdf_archiver.adapters.storage.layout import build_filename, build_target_dir
+from zammad_pdf_archiver.adapters.storage.layout import (
+    _allowed_prefix_segments,
+    build_filename,
+    build_target_dir,
+)
 
 
 def test_build_target_dir_is_deterministic_and_safe() -> None:
@@ -63,3 +67,16 @@ def test_build_filename_is_deterministic() -> None:
 
 def test_build_filename_sanitizes_path_separators() -> None:
     assert build_filename("123", "2026-02-07", "hello/there") == "123-2026-02-07-hello_there"
+
+
+def test_build_target_dir_parses_allow_prefixes_once(tmp_path: Path) -> None:
+    _allowed_prefix_segments.cache_clear()
+    for _ in range(3):
+        build_target_dir(
+            tmp_path,
+            "alice",
+            ["Customers", "ACME GmbH", "2024"],
+            allow_prefixes=["Customers > ACME GmbH"],
+        )
+
+    assert _allowed_prefix_segments.cache_info().misses == 1
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from zammad_pdf_archiver.adapters.pdf.render_cache import read_cached_pdf, store_cached_pdf
+
+
+def test_render_cache_roundtrip_and_miss(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+
+    assert read_cached_pdf(cache_dir, b"\x01" * 16) is None
+
+    store_cached_pdf(cache_dir, b"\x01" * 16, b"%PDF-1", max_bytes=0)
+
+    assert read_cached_pdf(cache_dir, b"\x01" * 16) == b"%PDF-1"
+    assert read_cached_pdf(cache_dir, b"\x02" * 16) is None
+    assert [p.name for p in cache_dir.iterdir()] == [f"{'01' * 16}.pdf"]
+
+
+def test_render_cache_ignores_empty_entries(tmp_path: Path) -> None:
+    (tmp_path / f"{'03' * 16}.pdf").write_bytes(b"")
+
+    assert read_cached_pdf(tmp_path, b"\x03" * 16) is None
+
+
+def test_render_cache_evicts_least_recently_used_over_budget(tmp_path: Path) -> None:
+    keys = [bytes([i]) * 16 for i in range(3)]
+    for i, key in enumerate(keys):
+        store_cached_pdf(tmp_path, key, b"x" * 10, max_bytes=0)
+        path = tmp_path / f"{key.hex()}.pdf"
+        os.utime(path, ns=(1_000_000_000 * (i + 1), 1_000_000_000 * (i + 1)))
+
+    # A hit makes the oldest entry the most recently used one.
+    assert read_cached_pdf(tmp_path, keys[0]) is not None
+
+    store_cached_pdf(tmp_path, b"\x09" * 16, b"x" * 10, max_bytes=30)
+
+    assert read_cached_pdf(tmp_path, keys[1]) is None
+    assert read_cached_pdf(tmp_path, keys[0]) is not None
+    assert read_cached_pdf(tmp_path, keys[2]) is not None
+    assert read_cached_pdf(tmp_path, b"\x09" * 16) is not None
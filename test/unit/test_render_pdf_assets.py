@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import sys
+import types
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from zammad_pdf_archiver.adapters.pdf import render_pdf as render_pdf_module
+from zammad_pdf_archiver.domain.snapshot_models import Snapshot
+
+
+class _StubCSS:
+    parsed: list[str] = []
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        _StubCSS.parsed.append(filename)
+
+
+class _StubHTML:
+    def __init__(self, **kwargs: object) -> None:
+        self.kwargs = kwargs
+
+    def write_pdf(self, target: io.BytesIO | None = None, **kwargs: object) -> bytes | None:
+        data = b"%PDF-stub"
+        if target is None:
+            return data
+        target.write(data)
+        return None
+
+
+@pytest.fixture
+def stub_weasyprint(monkeypatch: pytest.MonkeyPatch) -> Iterator[type[_StubCSS]]:
+    module = types.ModuleType("weasyprint")
+    setattr(module, "CSS", _StubCSS)  # noqa: B010
+    setattr(module, "HTML", _StubHTML)  # noqa: B010
+    setattr(module, "__version__", "0-stub")  # noqa: B010
+    monkeypatch.setitem(sys.modules, "weasyprint", module)
+    _StubCSS.parsed = []
+    render_pdf_module._load_template_assets.cache_clear()
+    yield _StubCSS
+    render_pdf_module._load_template_assets.cache_clear()
+
+
+def test_template_assets_are_cached_and_invalidated_on_change(
+    tmp_path: Path, stub_weasyprint: type[_StubCSS]
+) -> None:
+    template_dir = tmp_path / "default"
+    template_dir.mkdir()
+    styles = template_dir / "styles.css"
+    styles.write_text("body { color: black; }", encoding="utf-8")
+
+    first = render_pdf_module._template_assets(template_dir)
+    second = render_pdf_module._template_assets(template_dir)
+
+    assert second is first
+    assert first.css_bytes == b"body { color: black; }"
+    assert stub_weasyprint.parsed == [str(styles)]
+
+    styles.write_text("body { color: red; }", encoding="utf-8")
+    stat = styles.stat()
+    os.utime(styles, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = render_pdf_module._template_assets(template_dir)
+
+    assert third is not first
+    assert third.css_bytes == b"body { color: red; }"
+    assert stub_weasyprint.parsed == [str(styles), str(styles)]
+
+
+def test_css_file_paths_order_main_siblings_then_nested(tmp_path: Path) -> None:
+    template_dir = tmp_path / "default"
+    (template_dir / "css" / "sub").mkdir(parents=True)
+    (template_dir / "dir.css").mkdir()
+    for rel in ("z.css", "styles.css", "a.css", "css/b.css", "css/sub/a.css", "ticket.html"):
+        (template_dir / rel).write_text("", encoding="utf-8")
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "article-list.css").write_text("", encoding="utf-8")
+
+    paths = render_pdf_module._css_file_paths(template_dir)
+
+    assert [p.relative_to(tmp_path).as_posix() for p in paths] == [
+        "shared/article-list.css",
+        "default/styles.css",
+        "default/a.css",
+        "default/z.css",
+        "default/css/b.css",
+        "default/css/sub/a.css",
+    ]
+
+
+def test_pdf_identifier_falls_back_to_sha256(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(render_pdf_module, "_blake3", None)
+
+    identifier = render_pdf_module._pdf_identifier(b"<html></html>", b"body {}")
+
+    assert identifier == hashlib.sha256(b"<html></html>\0body {}").digest()[:16]
+
+
+def test_pdf_identifier_is_128_bit_and_covers_css() -> None:
+    first = render_pdf_module._pdf_identifier(b"<html></html>", b"body {}")
+
+    assert len(first) == 16
+    assert render_pdf_module._pdf_identifier(b"<html></html>", b"body {}") == first
+    assert render_pdf_module._pdf_identifier(b"<html></html>", b"p {}") != first
+
+
+def test_packaged_template_folder_is_resolved_once() -> None:
+    render_pdf_module._packaged_template_folder.cache_clear()
+
+    first = render_pdf_module._template_folder_path("default")
+    second = render_pdf_module._template_folder_path("default")
+
+    assert first == second
+    assert (first / "ticket.html").is_file()
+    assert render_pdf_module._packaged_template_folder.cache_info().hits == 1
+
+
+def test_template_assets_concatenate_many_stylesheets_in_order(
+    tmp_path: Path, stub_weasyprint: type[_StubCSS]
+) -> None:
+    template_dir = tmp_path / "default"
+    (template_dir / "css").mkdir(parents=True)
+    (template_dir / "styles.css").write_text("main;", encoding="utf-8")
+    for i in range(5):
+        (template_dir / "css" / f"part{i}.css").write_text(f"part{i};", encoding="utf-8")
+
+    assets = render_pdf_module._template_assets(template_dir)
+
+    assert assets.css_bytes == b"main;part0;part1;part2;part3;part4;"
+    assert len(stub_weasyprint.parsed) == 6
+
+
+def _snapshot() -> Snapshot:
+    return Snapshot.model_validate(
+        {
+            "ticket": {
+                "id": 1,
+                "number": "T1",
+                "title": "stream",
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+                "tags": [],
+                "custom_fields": {},
+            },
+            "articles": [],
+        }
+    )
+
+
+def test_render_pdf_streams_into_out(stub_weasyprint: type[_StubCSS]) -> None:
+    out = io.BytesIO()
+
+    result = render_pdf_module.render_pdf(_snapshot(), "default", out=out)
+
+    assert result is None
+    assert out.getvalue() == render_pdf_module.render_pdf(_snapshot(), "default")
+
+
+def test_render_pdf_streams_cache_hits_into_out(
+    tmp_path: Path, stub_weasyprint: type[_StubCSS]
+) -> None:
+    first = io.BytesIO()
+    second = io.BytesIO()
+
+    render_pdf_module.render_pdf(_snapshot(), "default", cache_dir=tmp_path, out=first)
+    render_pdf_module.render_pdf(_snapshot(), "default", cache_dir=tmp_path, out=second)
+
+    assert first.getvalue() == second.getvalue() == b"%PDF-stub"
+    assert len(list(tmp_path.glob("*.pdf"))) == 1
+
+
+def test_render_cache_misses_when_template_assets_or_weasyprint_change(
+    tmp_path: Path, stub_weasyprint: type[_StubCSS], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    template_dir = tmp_path / "templates" / "minimal"
+    template_dir.mkdir(parents=True)
+    (template_dir / "ticket.html").write_text("<html>{{ ticket.title }}</html>", "utf-8")
+    (template_dir / "styles.css").write_text("body {}", "utf-8")
+    logo = template_dir / "img" / "logo.svg"
+    logo.parent.mkdir()
+    logo.write_text("<svg/>", "utf-8")
+    cache_dir = tmp_path / "cache"
+
+    def render() -> None:
+        render_pdf_module.render_pdf(
+            _snapshot(), "minimal", templates_root=tmp_path / "templates", cache_dir=cache_dir
+        )
+
+    render()
+    render()
+    assert len(list(cache_dir.glob("*.pdf"))) == 1
+
+    logo.write_text("<svg width='2'/>", "utf-8")
+    render()
+    assert len(list(cache_dir.glob("*.pdf"))) == 2
+
+    monkeypatch.setattr(sys.modules["weasyprint"], "__version__", "1-stub")
+    render()
+    assert len(list(cache_dir.glob("*.pdf"))) == 3
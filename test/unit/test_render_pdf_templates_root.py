@@ -39,11 +39,13 @@ def test_render_pdf_passes_templates_root_to_render_html(tmp_path: Path, monkeyp
         locale: str = "de_DE",  # noqa: ARG001
         timezone: str = "Europe/Berlin",  # noqa: ARG001
         templates_root: Path | None = None,
-    ) -> str:
+        bytecode_cache_dir: Path | None = None,  # noqa: ARG001
+        auto_reload: bool = True,  # noqa: ARG001
+    ) -> bytes:
         captured["templates_root"] = templates_root
-        return "<html><body>ok</body></html>"
+        return b"<html><body>ok</body></html>"
 
-    monkeypatch.setattr(render_pdf_module, "render_html", _stub_render_html)
+    monkeypatch.setattr(render_pdf_module, "render_html_bytes", _stub_render_html)
 
     pdf_bytes = render_pdf_module.render_pdf(
         _snapshot(),
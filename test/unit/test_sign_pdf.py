@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -112,3 +113,32 @@ def test_sign_pdf_missing_pfx_path_raises() -> None:
     settings = _DummySettings(signing=_DummySigning(pfx_path=None, pfx_password=None))
     with pytest.raises(PermanentError, match="pfx_path"):
         sign_pdf(_minimal_pdf_bytes(), settings)
+
+
+def test_sign_pdf_reuses_loaded_signer_until_pfx_changes(tmp_path: Path, monkeypatch) -> None:
+    from zammad_pdf_archiver.adapters.signing import sign_pdf as sign_pdf_module
+
+    pfx_path = tmp_path / "test.pfx"
+    _write_test_pfx(pfx_path, password="secret")
+    settings = _DummySettings(
+        signing=_DummySigning(pfx_path=pfx_path, pfx_password="secret"),
+    )
+    loads = 0
+    real_simple_signer = sign_pdf_module._simple_signer
+
+    def _counting_simple_signer(*args):
+        nonlocal loads
+        loads += 1
+        return real_simple_signer(*args)
+
+    monkeypatch.setattr(sign_pdf_module, "_simple_signer", _counting_simple_signer)
+
+    sign_pdf(_minimal_pdf_bytes(), settings)
+    sign_pdf(_minimal_pdf_bytes(), settings)
+    assert loads == 1
+
+    _write_test_pfx(pfx_path, password="secret")
+    stat = pfx_path.stat()
+    os.utime(pfx_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    sign_pdf(_minimal_pdf_bytes(), settings)
+    assert loads == 2
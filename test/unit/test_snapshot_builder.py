@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import asyncio
 
+import pytest
+
+from zammad_pdf_archiver.adapters.snapshot import build_snapshot as build_snapshot_module
 from zammad_pdf_archiver.adapters.snapshot.build_snapshot import (
     build_snapshot,
     enrich_attachment_content,
@@ -64,6 +67,45 @@ def test_articles_are_sorted_chronologically() -> None:
     asyncio.run(run())
 
 
+class _BarrierZammadClient(_FakeZammadClient):
+    """Each fetch blocks until all three are in flight, so serial fetching would hang."""
+
+    def __init__(
+        self,
+        *,
+        ticket: ZammadTicket,
+        tags: list[str],
+        articles: list[ZammadArticle],
+    ) -> None:
+        super().__init__(ticket=ticket, tags=tags, articles=articles)
+        self._barrier = asyncio.Barrier(3)
+
+    async def get_ticket(self, ticket_id: int) -> ZammadTicket:
+        await self._barrier.wait()
+        return await super().get_ticket(ticket_id)
+
+    async def list_tags(self, ticket_id: int) -> TagList:
+        await self._barrier.wait()
+        return await super().list_tags(ticket_id)
+
+    async def list_articles(self, ticket_id: int) -> list[ZammadArticle]:
+        await self._barrier.wait()
+        return await super().list_articles(ticket_id)
+
+
+def test_ticket_tags_and_articles_are_fetched_concurrently() -> None:
+    async def run() -> None:
+        ticket = ZammadTicket.model_validate({"id": 1, "number": "T1"})
+        articles = [ZammadArticle.model_validate({"id": 1, "body": "only"})]
+        client = _BarrierZammadClient(ticket=ticket, tags=["a"], articles=articles)
+
+        snapshot = await asyncio.wait_for(build_snapshot(client, 1), timeout=5)
+        assert snapshot.ticket.tags == ["a"]
+        assert [a.id for a in snapshot.articles] == [1]
+
+    asyncio.run(run())
+
+
 def test_internal_flag_maps_none_to_false() -> None:
     async def run() -> None:
         ticket = ZammadTicket.model_validate({"id": 1, "number": "T1"})
@@ -221,8 +263,14 @@ def test_enrich_attachment_content_unchanged_when_disabled() -> None:
 async def _run_enrich_fills_content() -> None:
     class FakeAttachmentClient:
         async def get_attachment_content(
-            self, ticket_id: int, article_id: int, attachment_id: int
-        ) -> bytes:
+            self,
+            ticket_id: int,
+            article_id: int,
+            attachment_id: int,
+            *,
+            max_bytes: int | None = None,
+        ) -> bytes | None:
+            assert max_bytes == 100
             return b"binary data"
 
     snapshot = Snapshot(
@@ -251,3 +299,98 @@ async def _run_enrich_fills_content() -> None:
 def test_enrich_attachment_content_fills_content_when_enabled() -> None:
     """When include_attachment_binary is True and within limits, content is set (PRD §8.2)."""
     asyncio.run(_run_enrich_fills_content())
+
+
+_STRIP_SAMPLE = (
+    "<div>Hello&nbsp;<b>World</b></div><script>alert(1)</script>"
+    "<p>Second<br>line</p><ul><li>one</li><li>two</li></ul><style>p{}</style>tail"
+)
+
+
+def test_strip_html_to_text() -> None:
+    text = build_snapshot_module._strip_html_to_text(_STRIP_SAMPLE)
+
+    assert text == "Hello\xa0World\nSecond\nline\none\ntwo\ntail"
+
+
+def test_long_tickets_convert_articles_in_worker_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    jobs: list[int] = []
+
+    async def _inline_pool(worker_processes: int, job):
+        assert worker_processes == 3
+        result = job()
+        jobs.append(len(result))
+        return result
+
+    monkeypatch.setattr(build_snapshot_module, "run_in_worker_pool", _inline_pool)
+    ticket = ZammadTicket.model_validate({"id": 1, "number": "T1"})
+    articles = [
+        ZammadArticle.model_validate(
+            {"id": i, "created_at": f"2024-01-{i + 1:02d}T00:00:00Z", "body": f"<p>n{i}</p>"}
+        )
+        for i in range(20)
+    ]
+    client = _FakeZammadClient(ticket=ticket, tags=[], articles=articles)
+
+    parallel = asyncio.run(build_snapshot(client, 1, worker_processes=3))
+    inline = asyncio.run(build_snapshot(client, 1))
+
+    assert jobs == [7, 7, 6]
+    assert parallel == inline
+    assert [a.body_text for a in parallel.articles][:2] == ["n0", "n1"]
+
+
+def test_worker_batches_keep_article_order_and_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches: list[list[int]] = []
+
+    async def _inline_pool(worker_processes: int, job):
+        result = job()
+        batches.append([a.id for a in result])
+        return result
+
+    monkeypatch.setattr(build_snapshot_module, "run_in_worker_pool", _inline_pool)
+    # Descending ids: the conversion must not reorder, sorting happens later in build_snapshot.
+    articles = [
+        ZammadArticle.model_validate({"id": i, "body": f"n{i}"}) for i in range(17, 0, -1)
+    ]
+
+    converted = asyncio.run(
+        build_snapshot_module._convert_articles_async(articles, worker_processes=4)
+    )
+
+    assert [len(batch) for batch in batches] == [5, 5, 5, 2]
+    assert [a.id for a in converted] == list(range(17, 0, -1))
+
+
+def test_enrich_attachment_content_copies_only_changed_articles() -> None:
+    class FakeAttachmentClient:
+        async def get_attachment_content(
+            self,
+            ticket_id: int,
+            article_id: int,
+            attachment_id: int,
+            *,
+            max_bytes: int | None = None,
+        ) -> bytes | None:
+            return b"x" * 50 if attachment_id == 10 else b"y" * 500
+
+    snapshot = Snapshot(
+        ticket=TicketMeta(id=1, number="T1", title="t"),
+        articles=[
+            Article(id=1, attachments=[AttachmentMeta(article_id=1, attachment_id=10)]),
+            Article(id=2, attachments=[AttachmentMeta(article_id=2, attachment_id=20)]),
+        ],
+    )
+
+    result = asyncio.run(
+        enrich_attachment_content(
+            snapshot,
+            FakeAttachmentClient(),
+            include_attachment_binary=True,
+            max_attachment_bytes_per_file=100,
+            max_total_attachment_bytes=1000,
+        )
+    )
+
+    assert result.articles[0].attachments[0].content == b"x" * 50
+    assert result.articles[1] is snapshot.articles[1]
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import os
 from datetime import UTC, datetime
 
-from zammad_pdf_archiver.adapters.pdf.template_engine import render_html
+from jinja2 import FileSystemLoader
+
+from zammad_pdf_archiver.adapters.pdf.template_engine import (
+    _loader_for,
+    make_html_renderer,
+    render_html,
+    render_html_bytes,
+)
 from zammad_pdf_archiver.domain.snapshot_models import (
     Article,
     AttachmentMeta,
@@ -87,3 +95,91 @@ def test_compact_template_renders_example_snapshot() -> None:
     assert "Ticket T2" in html
     assert "Compact body" in html
     assert "compact" in html
+
+
+def test_bytecode_cache_dir_persists_compiled_templates(tmp_path) -> None:
+    snapshot = Snapshot(
+        ticket=TicketMeta(
+            id=1,
+            number="T1",
+            title="Bytecode cache",
+            created_at=datetime(2024, 1, 1, 10, 0, tzinfo=UTC),
+            updated_at=datetime(2024, 1, 2, 12, 30, tzinfo=UTC),
+        ),
+        articles=[],
+    )
+    cache_dir = tmp_path / "jinja"
+
+    html = render_html(snapshot, "minimal", bytecode_cache_dir=cache_dir)
+
+    assert "T1" in html
+    assert list(cache_dir.glob("*.cache"))
+
+
+def test_templates_root_auto_reload_can_be_disabled(tmp_path) -> None:
+    snapshot = Snapshot(
+        ticket=TicketMeta(
+            id=1,
+            number="T1",
+            title="Reload",
+            created_at=datetime(2024, 1, 1, 10, 0, tzinfo=UTC),
+            updated_at=datetime(2024, 1, 2, 12, 30, tzinfo=UTC),
+        ),
+        articles=[],
+    )
+    template = tmp_path / "minimal" / "ticket.html"
+    template.parent.mkdir()
+    template.write_text("v1", encoding="utf-8")
+
+    assert render_html(snapshot, "minimal", templates_root=tmp_path, auto_reload=False) == "v1"
+    template.write_text("v2", encoding="utf-8")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert render_html(snapshot, "minimal", templates_root=tmp_path, auto_reload=False) == "v1"
+    assert render_html(snapshot, "minimal", templates_root=tmp_path) == "v2"
+
+
+def test_render_html_bytes_matches_render_html() -> None:
+    snapshot = Snapshot(
+        ticket=TicketMeta(
+            id=1,
+            number="T1",
+            title="Ümlaut stream",
+            created_at=datetime(2024, 1, 1, 10, 0, tzinfo=UTC),
+            updated_at=datetime(2024, 1, 2, 12, 30, tzinfo=UTC),
+        ),
+        articles=[],
+    )
+
+    html = render_html(snapshot, "default")
+
+    assert render_html_bytes(snapshot, "default") == html.encode("utf-8")
+
+
+def test_packaged_templates_use_filesystem_loader_for_regular_installs() -> None:
+    loader = _loader_for("default", templates_root=None)
+
+    assert isinstance(loader, FileSystemLoader)
+    assert "default/ticket.html" in loader.list_templates()
+
+
+def test_make_html_renderer_is_reused_and_matches_render_html() -> None:
+    snapshot = Snapshot(
+        ticket=TicketMeta(
+            id=2,
+            number="T2",
+            title="Specialized",
+            created_at=datetime(2024, 1, 1, 10, 0, tzinfo=UTC),
+            updated_at=datetime(2024, 1, 2, 12, 30, tzinfo=UTC),
+        ),
+        articles=[],
+    )
+
+    renderer = make_html_renderer("default", locale="en_US", timezone="UTC")
+
+    assert make_html_renderer("default", locale="en_US", timezone="UTC") is renderer
+    assert make_html_renderer("default", locale="en_US", timezone="Europe/Berlin") is not renderer
+    assert renderer(snapshot) == render_html(
+        snapshot, "default", locale="en_US", timezone="UTC"
+    ).encode("utf-8")
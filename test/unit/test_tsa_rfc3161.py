@@ -13,7 +13,10 @@ from zammad_pdf_archiver.domain.errors import PermanentError, TransientError
 
 pytest.importorskip("pyhanko", reason="TSA adapter requires pyHanko")
 
-from zammad_pdf_archiver.adapters.signing.tsa_rfc3161 import build_timestamper  # noqa: E402
+from zammad_pdf_archiver.adapters.signing.tsa_rfc3161 import (  # noqa: E402
+    build_timestamper,
+    close_tsa_clients,
+)
 
 
 def _tsa_req() -> Any:
@@ -134,17 +137,14 @@ def test_tsa_http_client_respects_transport_trust_env(
 
     captured: dict[str, Any] = {}
 
-    class _DummyAsyncClient:
+    class _DummyClient:
         def __init__(self, *args: Any, **kwargs: Any) -> None:
             captured["trust_env"] = kwargs.get("trust_env")
 
-        async def __aenter__(self) -> _DummyAsyncClient:
-            return self
+        def close(self) -> None:
+            pass
 
-        async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
-            return False
-
-        async def post(
+        def post(
             self,
             url: str,
             *,
@@ -154,9 +154,32 @@ def test_tsa_http_client_respects_transport_trust_env(
         ) -> httpx.Response:  # noqa: ARG002
             return httpx.Response(500)
 
-    monkeypatch.setattr(httpx, "AsyncClient", _DummyAsyncClient)
+    monkeypatch.setattr(httpx, "Client", _DummyClient)
+    close_tsa_clients()
 
     with pytest.raises(TransientError, match="RFC3161 TSA returned HTTP 500"):
         asyncio.run(timestamper.async_request_tsa_response(_tsa_req()))
+    close_tsa_clients()
 
     assert captured["trust_env"] is trust_env
+
+
+def test_tsa_client_is_reused_across_requests() -> None:
+    tsa_url = "https://tsa-reuse.test/rfc3161"
+    settings = _DummySettings(
+        signing=_DummySigning(
+            timestamp=_DummyTimestamp(enabled=True, rfc3161=_DummyRfc3161(tsa_url=tsa_url))
+        )
+    )
+    close_tsa_clients()
+
+    with respx.mock:
+        respx.post(tsa_url).mock(return_value=httpx.Response(503))
+        for _ in range(2):
+            with pytest.raises(TransientError):
+                asyncio.run(build_timestamper(settings).async_request_tsa_response(_tsa_req()))
+
+    from zammad_pdf_archiver.adapters.signing import tsa_rfc3161
+
+    assert len(tsa_rfc3161._CLIENTS) == 1
+    close_tsa_clients()
@@ -5,9 +5,15 @@ import asyncio
 import httpx
 import pytest
 import respx
+from pydantic import ValidationError
 
-from zammad_pdf_archiver.adapters.zammad.client import AsyncZammadClient
-from zammad_pdf_archiver.adapters.zammad.errors import AuthError, NotFoundError, ServerError
+from zammad_pdf_archiver.adapters.zammad.client import AsyncZammadClient, _RetryPolicy
+from zammad_pdf_archiver.adapters.zammad.errors import (
+    AuthError,
+    ClientError,
+    NotFoundError,
+    ServerError,
+)
 
 
 async def _no_sleep(_: float) -> None:
@@ -66,6 +72,29 @@ def test_list_tags_success() -> None:
         asyncio.run(run())
 
 
+def test_list_tags_accepts_object_wrapper() -> None:
+    async def run() -> None:
+        async with AsyncZammadClient(
+            base_url="https://zammad.example",
+            api_token="test-token",
+            sleep=_no_sleep,
+        ) as client:
+            assert (await client.list_tags(123)).root == ["archived"]
+            with pytest.raises(ClientError, match="tags response format unexpected"):
+                await client.list_tags(124)
+
+    with respx.mock:
+        respx.get(
+            "https://zammad.example/api/v1/tags",
+            params={"object": "Ticket", "o_id": "123"},
+        ).mock(return_value=httpx.Response(200, json={"tags": ["archived"]}))
+        respx.get(
+            "https://zammad.example/api/v1/tags",
+            params={"object": "Ticket", "o_id": "124"},
+        ).mock(return_value=httpx.Response(200, json={"tags": [{"name": "archived"}]}))
+        asyncio.run(run())
+
+
 def test_add_tag_success() -> None:
     async def run() -> None:
         async with AsyncZammadClient(
@@ -150,6 +179,76 @@ def test_get_attachment_content_success() -> None:
         asyncio.run(run())
 
 
+def test_iter_attachment_content_yields_chunks() -> None:
+    async def run() -> None:
+        async with AsyncZammadClient(
+            base_url="https://zammad.example",
+            api_token="test-token",
+            sleep=_no_sleep,
+        ) as client:
+            chunks = [c async for c in client.iter_attachment_content(1, 2, 3, chunk_size=4)]
+            assert chunks == [b"bina", b"ry c", b"onte", b"nt"]
+
+    with respx.mock:
+        respx.get("https://zammad.example/api/v1/ticket_attachment/1/2/3").mock(
+            return_value=httpx.Response(200, content=b"binary content")
+        )
+        asyncio.run(run())
+
+
+def test_get_attachment_content_stops_past_max_bytes() -> None:
+    async def run() -> None:
+        async with AsyncZammadClient(
+            base_url="https://zammad.example",
+            api_token="test-token",
+            sleep=_no_sleep,
+        ) as client:
+            assert await client.get_attachment_content(1, 2, 3, max_bytes=5) is None
+            assert await client.get_attachment_content(1, 2, 3, max_bytes=14) == b"binary content"
+
+    with respx.mock:
+        respx.get("https://zammad.example/api/v1/ticket_attachment/1/2/3").mock(
+            return_value=httpx.Response(200, content=b"binary content")
+        )
+        asyncio.run(run())
+
+
+class _BrokenBodyStream(httpx.AsyncByteStream):
+    """Yields a partial body, then fails like a connection reset mid-transfer."""
+
+    async def __aiter__(self):
+        yield b"bin"
+        raise httpx.ReadError("connection reset mid-body")
+
+
+def test_get_attachment_content_retries_body_failures() -> None:
+    async def run() -> None:
+        async with AsyncZammadClient(
+            base_url="https://zammad.example",
+            api_token="test-token",
+            sleep=_no_sleep,
+        ) as client:
+            assert await client.get_attachment_content(1, 2, 3, max_bytes=100) == (
+                b"binary content"
+            )
+            with pytest.raises(ServerError):
+                await client.get_attachment_content(1, 2, 4)
+
+    with respx.mock:
+        retried = respx.get("https://zammad.example/api/v1/ticket_attachment/1/2/3").mock(
+            side_effect=[
+                httpx.Response(200, stream=_BrokenBodyStream()),
+                httpx.Response(200, content=b"binary content"),
+            ]
+        )
+        exhausted = respx.get("https://zammad.example/api/v1/ticket_attachment/1/2/4").mock(
+            side_effect=lambda request: httpx.Response(200, stream=_BrokenBodyStream())
+        )
+        asyncio.run(run())
+        assert retried.call_count == 2
+        assert exhausted.call_count == 4
+
+
 def test_list_articles_success() -> None:
     async def run() -> None:
         async with AsyncZammadClient(
@@ -246,3 +345,51 @@ def test_5xx_raises_server_error_after_retries() -> None:
         )
         asyncio.run(run())
         assert route.call_count == 4
+
+
+def test_retry_backoff_is_jittered_up_to_exponential_cap() -> None:
+    delays: list[float] = []
+
+    async def record_sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    async def run() -> None:
+        async with AsyncZammadClient(
+            base_url="https://zammad.example",
+            api_token="test-token",
+            sleep=record_sleep,
+            retry_policy=_RetryPolicy(backoff_base_seconds=1.0, rng=lambda: 0.5),
+        ) as client:
+            with pytest.raises(ServerError):
+                await client.get_ticket(123)
+
+    with respx.mock:
+        respx.get("https://zammad.example/api/v1/tickets/123").mock(
+            return_value=httpx.Response(503, json={"error": "busy"})
+        )
+        asyncio.run(run())
+
+    assert delays == [0.5, 1.0, 2.0]
+    assert all(0.0 <= _RetryPolicy().backoff_seconds(3) <= 1.6 for _ in range(100))
+
+
+def test_malformed_json_raises_client_error() -> None:
+    async def run() -> None:
+        async with AsyncZammadClient(
+            base_url="https://zammad.example",
+            api_token="test-token",
+            sleep=_no_sleep,
+        ) as client:
+            with pytest.raises(ClientError, match="Invalid JSON"):
+                await client.list_articles(123)
+            with pytest.raises(ValidationError):
+                await client.get_ticket(123)
+
+    with respx.mock:
+        respx.get("https://zammad.example/api/v1/ticket_articles/by_ticket/123").mock(
+            return_value=httpx.Response(200, content=b"[{")
+        )
+        respx.get("https://zammad.example/api/v1/tickets/123").mock(
+            return_value=httpx.Response(200, json={"number": "no id"})
+        )
+        asyncio.run(run())